@@ -6,16 +6,28 @@ This script downloads ffmpeg and ffprobe binaries for different platforms.
 Run this before building the application.
 """
 
+import io
 import os
 import sys
+import logging
 import platform
 import urllib.request
 import zipfile
 import tarfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# Console output for the build scripts (plain messages, like print)
+log = logging.getLogger("vc.download")
+log.setLevel(logging.INFO)
+log.propagate = False
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter('%(message)s'))
+log.addHandler(_console_handler)
+
+
 # Download URLs for ffmpeg static builds
 FFMPEG_URLS = {
     "windows": {
@@ -42,18 +54,73 @@ FFMPEG_URLS = {
     }
 }
 
+# Read size used when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Parallel range downloads: number of connections, and the smallest file
+# worth splitting
+DOWNLOAD_PARTS = 4
+MIN_PARALLEL_SIZE = 8 << 20
+
 
 def download_file(url: str, dest: Path) -> bool:
     """Download a file from URL."""
-    print(f"Downloading: {url}")
+    log.info(f"Downloading: {url}")
     try:
-        urllib.request.urlretrieve(url, dest)
+        # Stream straight to disk in 1 MiB chunks
+        with urllib.request.urlopen(url, timeout=60) as response, open(dest, 'wb') as f:
+            shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
         return True
     except Exception as e:
-        print(f"Download failed: {e}")
+        log.error(f"Download failed: {e}")
         return False
 
 
+def fetch_bytes(url: str) -> bytearray:
+    """
+    Download a URL into memory.
+    
+    If the server accepts byte ranges, the file is fetched with
+    DOWNLOAD_PARTS parallel range requests, which helps when a mirror
+    throttles each connection. Otherwise a single request is used.
+    """
+    try:
+        request = urllib.request.Request(url, method='HEAD')
+        with urllib.request.urlopen(request, timeout=60) as response:
+            size = int(response.headers.get('Content-Length') or 0)
+            accepts_ranges = response.headers.get('Accept-Ranges') == 'bytes'
+            url = response.geturl()  # Resolve redirects once for all parts
+    except (OSError, ValueError):
+        size, accepts_ranges = 0, False
+    
+    if not accepts_ranges or size < MIN_PARALLEL_SIZE:
+        with urllib.request.urlopen(url, timeout=60) as response:
+            return bytearray(response.read())
+    
+    buffer = bytearray(size)
+    part_size = -(-size // DOWNLOAD_PARTS)
+    
+    def fetch_range(start: int):
+        end = min(start + part_size, size)
+        request = urllib.request.Request(url, headers={'Range': f'bytes={start}-{end - 1}'})
+        with urllib.request.urlopen(request, timeout=60) as response:
+            if response.status != 206:
+                raise OSError(f"Range request not honored (HTTP {response.status})")
+            with memoryview(buffer) as view:
+                offset = start
+                while offset < end:
+                    read = response.readinto(view[offset:end])
+                    if not read:
+                        raise OSError(f"Connection closed at byte {offset} of {size}")
+                    offset += read
+    
+    log.info(f"  {size / (1 << 20):.1f} MiB in {DOWNLOAD_PARTS} parallel parts")
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_PARTS) as executor:
+        list(executor.map(fetch_range, range(0, size, part_size)))
+    
+    return buffer
+
+
 def extract_7z(archive_path: Path, dest_dir: Path) -> bool:
     """Extract 7z archive. Requires 7z or 7za command."""
     # Try different 7z commands
@@ -64,34 +131,44 @@ def extract_7z(archive_path: Path, dest_dir: Path) -> bool:
                                     capture_output=True)
             return result.returncode == 0
     
-    print("Error: 7z not found. Please install p7zip.")
+    log.error("Error: 7z not found. Please install p7zip.")
     return False
 
 
 def download_for_windows(target_dir: Path) -> bool:
     """Download ffmpeg for Windows."""
     config = FFMPEG_URLS["windows"]
-    temp_file = target_dir / "ffmpeg_temp.zip"
     
-    if not download_file(config["url"], temp_file):
+    log.info(f"Downloading: {config['url']}")
+    try:
+        # zip needs random access, so buffer in memory instead of a temp file
+        archive = io.BytesIO(fetch_bytes(config["url"]))
+    except Exception as e:
+        log.error(f"Download failed: {e}")
         return False
     
-    print("Extracting...")
+    log.info("Extracting...")
     try:
-        with zipfile.ZipFile(temp_file, 'r') as zf:
-            # Find ffmpeg and ffprobe in the zip
-            for name in zf.namelist():
-                if name.endswith(config["ffmpeg"]):
-                    zf.extract(name, target_dir)
-                    shutil.move(target_dir / name, target_dir / config["ffmpeg"])
-                elif name.endswith(config["ffprobe"]):
-                    zf.extract(name, target_dir)
-                    shutil.move(target_dir / name, target_dir / config["ffprobe"])
+        with zipfile.ZipFile(archive, 'r') as zf:
+            # Find ffmpeg and ffprobe in the zip, skip the remaining
+            # docs/presets once both are extracted
+            found = 0
+            for info in zf.infolist():
+                if info.filename.endswith(config["ffmpeg"]):
+                    binary_name = config["ffmpeg"]
+                elif info.filename.endswith(config["ffprobe"]):
+                    binary_name = config["ffprobe"]
+                else:
+                    continue
+                zf.extract(info, target_dir)
+                shutil.move(target_dir / info.filename, target_dir / binary_name)
+                found += 1
+                if found == 2:
+                    break
         
-        temp_file.unlink()
         return True
     except Exception as e:
-        print(f"Extraction failed: {e}")
+        log.error(f"Extraction failed: {e}")
         return False
 
 
@@ -126,24 +203,26 @@ def download_for_macos(target_dir: Path) -> bool:
 def download_for_linux(target_dir: Path) -> bool:
     """Download ffmpeg for Linux."""
     config = FFMPEG_URLS["linux"]
-    temp_file = target_dir / "ffmpeg_temp.tar.xz"
     
-    if not download_file(config["url"], temp_file):
-        return False
-    
-    print("Extracting...")
+    log.info(f"Downloading: {config['url']}")
     try:
-        with tarfile.open(temp_file, 'r:xz') as tf:
+        # Decompress the tar.xz straight from the HTTP stream, no temp file
+        with urllib.request.urlopen(config["url"], timeout=60) as response, \
+                tarfile.open(fileobj=response, mode='r|xz') as tf:
+            log.info("Extracting...")
             # Find ffmpeg and ffprobe
-            for member in tf.getmembers():
+            found = 0
+            for member in tf:
                 if member.name.endswith(config["ffmpeg"]):
                     member.name = config["ffmpeg"]
-                    tf.extract(member, target_dir)
                 elif member.name.endswith(config["ffprobe"]):
                     member.name = config["ffprobe"]
-                    tf.extract(member, target_dir)
-        
-        temp_file.unlink()
+                else:
+                    continue
+                tf.extract(member, target_dir)
+                found += 1
+                if found == 2:
+                    break
         
         # Set executable permission
         ffmpeg_path = target_dir / config["ffmpeg"]
@@ -156,7 +235,7 @@ def download_for_linux(target_dir: Path) -> bool:
         
         return True
     except Exception as e:
-        print(f"Extraction failed: {e}")
+        log.error(f"Download/extraction failed: {e}")
         return False
 
 
@@ -180,7 +259,7 @@ def download_ffmpeg(target_platform: str | None = None) -> bool:
             target_platform = "linux"
     
     if target_platform not in FFMPEG_URLS:
-        print(f"Unsupported platform: {target_platform}")
+        log.error(f"Unsupported platform: {target_platform}")
         return False
     
     # Create ffmpeg_bin directory
@@ -188,8 +267,8 @@ def download_ffmpeg(target_platform: str | None = None) -> bool:
     target_dir = script_dir / "ffmpeg_bin" / target_platform
     target_dir.mkdir(parents=True, exist_ok=True)
     
-    print(f"Downloading ffmpeg for {target_platform}...")
-    print(f"Target directory: {target_dir}")
+    log.info(f"Downloading ffmpeg for {target_platform}...")
+    log.info(f"Target directory: {target_dir}")
     
     if target_platform == "windows":
         success = download_for_windows(target_dir)
@@ -199,24 +278,27 @@ def download_ffmpeg(target_platform: str | None = None) -> bool:
         success = download_for_linux(target_dir)
     
     if success:
-        print(f"\n[OK] ffmpeg binaries downloaded to: {target_dir}")
-        print(f"  - ffmpeg: {(target_dir / FFMPEG_URLS[target_platform]['ffmpeg']).exists()}")
-        print(f"  - ffprobe: {(target_dir / FFMPEG_URLS[target_platform]['ffprobe']).exists()}")
+        log.info(f"\n[OK] ffmpeg binaries downloaded to: {target_dir}")
+        log.info(f"  - ffmpeg: {(target_dir / FFMPEG_URLS[target_platform]['ffmpeg']).exists()}")
+        log.info(f"  - ffprobe: {(target_dir / FFMPEG_URLS[target_platform]['ffprobe']).exists()}")
     else:
-        print(f"\n[FAIL] Failed to download ffmpeg")
+        log.error(f"\n[FAIL] Failed to download ffmpeg")
     
     return success
 
 
 def download_all_platforms():
-    """Download ffmpeg for all platforms."""
-    success = True
-    for platform_name in ["windows", "macos", "linux"]:
-        print(f"\n{'='*50}")
-        if not download_ffmpeg(platform_name):
-            success = False
+    """Download ffmpeg for all platforms (concurrently, downloads are I/O bound)."""
+    platform_names = ["windows", "macos", "linux"]
     
-    return success
+    with ThreadPoolExecutor(max_workers=len(platform_names)) as executor:
+        results = list(executor.map(download_ffmpeg, platform_names))
+    
+    log.info(f"\n{'='*50}")
+    for platform_name, ok in zip(platform_names, results):
+        log.info(f"  {platform_name}: {'OK' if ok else 'FAIL'}")
+    
+    return all(results)
 
 
 if __name__ == "__main__":
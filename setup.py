@@ -1,4 +1,17 @@
+import os
+
 from setuptools import setup, find_packages
+from setuptools.command.build_ext import build_ext
+
+
+class ParallelBuildExt(build_ext):
+    """build_ext that compiles in parallel (one job per CPU) unless -j is given."""
+
+    def finalize_options(self):
+        if self.parallel is None:
+            self.parallel = os.cpu_count() or 1
+        super().finalize_options()
+
 
 setup(
     name="video-cutter",
@@ -8,6 +21,7 @@ setup(
     python_requires=">=3.8",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    cmdclass={"build_ext": ParallelBuildExt},
     entry_points={
         "console_scripts": [
             "video-cutter=src.main:main",
@@ -17,6 +31,7 @@ setup(
         "PyQt6>=6.5.0",
         "openpyxl>=3.1.0",
         "python-dateutil>=2.8.0",
+        "python-calamine>=0.2.0",
     ],
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -0,0 +1,277 @@
+"""Minimal MP4/MOV and MKV/WebM header readers for fast video probing."""
+import os
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+# Largest box/element payload read into memory; anything bigger is skipped
+_MAX_READ = 1 << 20
+
+_MP4_EXTENSIONS = frozenset({'.mp4', '.mov', '.m4v'})
+_MKV_EXTENSIONS = frozenset({'.mkv', '.webm'})
+
+# Matroska element IDs (with their length marker bits)
+_EBML = 0x1A45DFA3
+_SEGMENT = 0x18538067
+_INFO = 0x1549A966
+_TIMECODE_SCALE = 0x2AD7B1
+_DURATION = 0x4489
+_TRACKS = 0x1654AE6B
+_TRACK_ENTRY = 0xAE
+_TRACK_TYPE = 0x83
+_DEFAULT_DURATION = 0x23E383
+_VIDEO = 0xE0
+_PIXEL_WIDTH = 0xB0
+_PIXEL_HEIGHT = 0xBA
+_CLUSTER = 0x1F43B675
+
+
+def probe_container(video_path: Path) -> tuple[float, int, int, int, float] | None:
+    """
+    Read duration, size, bitrate and frame rate straight from the container
+    headers, without libavformat or a subprocess.
+    
+    Only MP4/MOV and MKV/WebM are understood. The bitrate is estimated from
+    the file size like ffprobe's format bit_rate.
+    
+    Args:
+        video_path: Path to video file
+    
+    Returns:
+        (duration, width, height, bitrate, fps), or None if the file is
+        another format or its headers can't be read
+    """
+    suffix = video_path.suffix.lower()
+    if suffix in _MP4_EXTENSIONS:
+        reader = _probe_mp4
+    elif suffix in _MKV_EXTENSIONS:
+        reader = _probe_mkv
+    else:
+        return None
+    
+    try:
+        with open(video_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            result = reader(f, file_size)
+    except (OSError, ValueError, struct.error):
+        return None
+    if result is None:
+        return None
+    
+    duration, width, height, fps = result
+    if duration <= 0 or not width or not height:
+        return None
+    return (duration, width, height, int(file_size * 8 / duration), fps or 30.0)
+
+
+def _iter_boxes(f: BinaryIO, start: int, end: int) -> Iterator[tuple[bytes, int, int]]:
+    """Yield (type, payload_start, payload_end) for the boxes in [start, end)."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        size, box_type = struct.unpack('>I4s', header)
+        payload = pos + 8
+        if size == 1:
+            size = struct.unpack('>Q', f.read(8))[0]
+            payload += 8
+        elif size == 0:
+            size = end - pos  # Box extends to the end of its parent
+        if size < payload - pos:
+            return
+        yield box_type, payload, pos + size
+        pos += size
+
+
+def _find_box(f: BinaryIO, start: int, end: int, box_type: bytes) -> tuple[int, int] | None:
+    """Find the first child box of a type, as (payload_start, payload_end)."""
+    for child_type, payload, child_end in _iter_boxes(f, start, end):
+        if child_type == box_type:
+            return payload, child_end
+    return None
+
+
+def _read_box(f: BinaryIO, box: tuple[int, int] | None) -> bytes:
+    """Read a box payload, empty if the box is missing or too large."""
+    if box is None or box[1] - box[0] > _MAX_READ:
+        return b''
+    f.seek(box[0])
+    return f.read(box[1] - box[0])
+
+
+def _probe_mp4(f: BinaryIO, file_size: int) -> tuple[float, int, int, float] | None:
+    """Read mvhd and the first video trak from the moov box."""
+    # moov is at the start (faststart) or after mdat (e.g. OBS recordings)
+    moov = _find_box(f, 0, file_size, b'moov')
+    if moov is None:
+        return None
+    
+    mvhd = _read_box(f, _find_box(f, *moov, b'mvhd'))
+    if len(mvhd) < 32:
+        return None
+    if mvhd[0] == 1:
+        timescale, duration = struct.unpack_from('>IQ', mvhd, 20)
+    else:
+        timescale, duration = struct.unpack_from('>II', mvhd, 12)
+    if not timescale:
+        return None
+    
+    for box_type, payload, box_end in _iter_boxes(f, *moov):
+        if box_type != b'trak':
+            continue
+        mdia = _find_box(f, payload, box_end, b'mdia')
+        if mdia is None:
+            continue
+        hdlr = _read_box(f, _find_box(f, *mdia, b'hdlr'))
+        if hdlr[8:12] != b'vide':
+            continue
+        
+        # Media timescale, for frame durations in stts
+        mdhd = _read_box(f, _find_box(f, *mdia, b'mdhd'))
+        if mdhd[:1] == b'\x01':
+            media_timescale = struct.unpack_from('>I', mdhd, 20)[0]
+        else:
+            media_timescale = struct.unpack_from('>I', mdhd, 12)[0]
+        
+        minf = _find_box(f, *mdia, b'minf')
+        stbl = minf and _find_box(f, *minf, b'stbl')
+        if not stbl:
+            return None
+        
+        # Coded size from the first sample entry (VisualSampleEntry)
+        stsd = _read_box(f, _find_box(f, *stbl, b'stsd'))
+        if len(stsd) < 44:
+            return None
+        width, height = struct.unpack_from('>HH', stsd, 40)
+        
+        # Frame rate from the most common sample duration
+        fps = 0.0
+        stts = _read_box(f, _find_box(f, *stbl, b'stts'))
+        if len(stts) >= 16:
+            count = min(struct.unpack_from('>I', stts, 4)[0], (len(stts) - 8) // 8)
+            if count:
+                entries = struct.unpack_from(f'>{count * 2}I', stts, 8)
+                _, delta = max(zip(entries[::2], entries[1::2]))
+                if delta:
+                    fps = media_timescale / delta
+        
+        return duration / timescale, width, height, fps
+    
+    return None
+
+
+def _read_vint(f: BinaryIO, keep_marker: bool) -> tuple[int, int]:
+    """
+    Read an EBML variable-length integer.
+    
+    Returns:
+        (value, length in bytes); value is -1 for an unknown size
+    """
+    first = f.read(1)
+    if not first:
+        raise ValueError("Unexpected end of file")
+    byte = first[0]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not byte & mask:
+        mask >>= 1
+        length += 1
+    if length > 8:
+        raise ValueError("Invalid EBML integer")
+    
+    value = byte if keep_marker else byte & (mask - 1)
+    rest = f.read(length - 1)
+    if len(rest) != length - 1:
+        raise ValueError("Unexpected end of file")
+    for b in rest:
+        value = (value << 8) | b
+    
+    if not keep_marker and value == (1 << (7 * length)) - 1:
+        return -1, length
+    return value, length
+
+
+def _iter_elements(f: BinaryIO, start: int, end: int) -> Iterator[tuple[int, int, int]]:
+    """Yield (id, data_start, data_end) for the elements in [start, end)."""
+    pos = start
+    while pos < end:
+        f.seek(pos)
+        element_id, id_length = _read_vint(f, keep_marker=True)
+        size, size_length = _read_vint(f, keep_marker=False)
+        data = pos + id_length + size_length
+        data_end = end if size < 0 else data + size
+        yield element_id, data, data_end
+        pos = data_end
+
+
+def _read_element(f: BinaryIO, data: int, data_end: int) -> bytes:
+    """Read an element's data."""
+    if data_end - data > _MAX_READ:
+        return b''
+    f.seek(data)
+    return f.read(data_end - data)
+
+
+def _probe_mkv(f: BinaryIO, file_size: int) -> tuple[float, int, int, float] | None:
+    """Read Info and the first video TrackEntry from the Segment."""
+    segment = None
+    for element_id, data, data_end in _iter_elements(f, 0, file_size):
+        if element_id == _SEGMENT:
+            segment = (data, min(data_end, file_size))
+            break
+        if element_id != _EBML:
+            return None
+    if segment is None:
+        return None
+    
+    timecode_scale = 1_000_000  # ns per tick (Matroska default)
+    duration = None
+    video = None
+    
+    for element_id, data, data_end in _iter_elements(f, *segment):
+        if element_id == _INFO:
+            for child_id, child, child_end in _iter_elements(f, data, data_end):
+                raw = _read_element(f, child, child_end)
+                if child_id == _TIMECODE_SCALE:
+                    timecode_scale = int.from_bytes(raw, 'big')
+                elif child_id == _DURATION and len(raw) in (4, 8):
+                    duration = struct.unpack('>f' if len(raw) == 4 else '>d', raw)[0]
+        elif element_id == _TRACKS:
+            video = _find_mkv_video_track(f, data, data_end)
+        elif element_id == _CLUSTER:
+            # Media data; headers written after it are not worth a scan
+            break
+        if duration is not None and video is not None:
+            break
+    
+    if duration is None or video is None:
+        return None
+    width, height, frame_ns = video
+    # DefaultDuration is whole ns, so 24 fps comes back as 24.0000004
+    fps = round(1e9 / frame_ns, 3) if frame_ns else 0.0
+    return duration * timecode_scale / 1e9, width, height, fps
+
+
+def _find_mkv_video_track(f: BinaryIO, start: int, end: int) -> tuple[int, int, int] | None:
+    """Find the first video track in Tracks, as (width, height, frame duration ns)."""
+    for element_id, data, data_end in _iter_elements(f, start, end):
+        if element_id != _TRACK_ENTRY:
+            continue
+        track_type = width = height = frame_ns = 0
+        for child_id, child, child_end in _iter_elements(f, data, data_end):
+            if child_id == _TRACK_TYPE:
+                track_type = int.from_bytes(_read_element(f, child, child_end), 'big')
+            elif child_id == _DEFAULT_DURATION:
+                frame_ns = int.from_bytes(_read_element(f, child, child_end), 'big')
+            elif child_id == _VIDEO:
+                for video_id, value, value_end in _iter_elements(f, child, child_end):
+                    if video_id == _PIXEL_WIDTH:
+                        width = int.from_bytes(_read_element(f, value, value_end), 'big')
+                    elif video_id == _PIXEL_HEIGHT:
+                        height = int.from_bytes(_read_element(f, value, value_end), 'big')
+        if track_type == 1:
+            return width, height, frame_ns
+    return None
@@ -1,20 +1,53 @@
 """Excel parser for video clip definitions."""
+import re
 import logging
+from itertools import islice
 from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
+from typing import Iterator
 
 from openpyxl import load_workbook
 
+try:
+    # Optional Rust-backed reader, much faster than openpyxl on large sheets
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
 # Setup logger
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.addHandler(logging.NullHandler())
 
-# Console handler for debugging
+# Console handler for debugging, attached by parse_excel_clips(debug=True)
+# and removed again by the next parse without debug
 _console_handler = logging.StreamHandler()
 _console_handler.setLevel(logging.DEBUG)
 _console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-logger.addHandler(_console_handler)
+
+# Single datetime, e.g. "2026-01-15 10:45:02"
+_TIME_RE = re.compile(r'(\d{4})[-.](\d{2})[-.](\d{2})[\s_](\d{2}):(\d{2}):(\d{2})')
+
+# Flexible datetime pattern - supports multiple date/time formats
+# 2026-01-15 10:45:02, 2026/01/15 10:45:02, 2026.01.15 10:45:02
+# Also handles single-digit: 2026-1-5 10:45:02
+_DT_RE = re.compile(r'(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})[\s_]+(\d{1,2}):(\d{1,2}):(\d{1,2})')
+
+# Time string normalization: "止" with any surrounding whitespace, or a
+# whitespace run (including line breaks), in one pass
+_NORM_RE = re.compile(r'\s*止\s*|\s+')
+
+# Header names accepted by exact matching
+_EXACT_TIME_HEADERS = frozenset(["起止时间点", "起止时间", "起始时间点", "起始时间", "开始时间", "时间"])
+_EXACT_DESC_HEADERS = frozenset(["问题描述", "描述", "标题", "片段名称"])
+
+# Characters not allowed in output filenames
+_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
+def _norm_repl(match: re.Match) -> str:
+    """Replacement for _NORM_RE matches."""
+    return ' 止 ' if '止' in match.group() else ' '
 
 
 @dataclass
@@ -31,11 +64,8 @@ class ClipDefinition:
     
     def get_output_filename(self) -> str:
         """Generate output filename from description."""
-        # Clean description for filename
-        clean_desc = self.description.strip()
-        # Remove invalid filename characters
-        for char in '<>:"/\\|?*':
-            clean_desc = clean_desc.replace(char, '_')
+        # Clean description and replace invalid filename characters
+        clean_desc = self.description.strip().translate(_FILENAME_TRANS)
         return f"{clean_desc}.mp4"
 
 
@@ -47,24 +77,62 @@ def parse_time_string(time_str: str) -> datetime | None:
     - "起 2026-01-15 10:45:02 止 2026-01-15 11:30:00"
     - "2026-01-15 10:45:02"
     """
-    import re
-    
-    # Pattern for datetime
-    pattern = r'(\d{4})[-.](\d{2})[-.](\d{2})[\s_](\d{2}):(\d{2}):(\d{2})'
-    match = re.search(pattern, time_str)
+    match = _TIME_RE.search(time_str)
     
     if match:
         try:
-            return datetime(
-                int(match.group(1)), int(match.group(2)), int(match.group(3)),
-                int(match.group(4)), int(match.group(5)), int(match.group(6))
-            )
+            return datetime(*map(int, match.groups()))
         except ValueError:
             return None
     
     return None
 
 
+def _find_datetimes(text: str) -> list[tuple[str, ...]]:
+    """Return the groups of the first two _DT_RE matches in text."""
+    return [m.groups() for m in islice(_DT_RE.finditer(text), 2)]
+
+
+def _iter_sheet_rows(excel_path: Path) -> Iterator[tuple]:
+    """
+    Iterate cell values of the active worksheet, row by row.
+    
+    Uses python-calamine for single-sheet workbooks when available,
+    otherwise openpyxl in read-only mode.
+    """
+    if CalamineWorkbook is not None:
+        workbook = CalamineWorkbook.from_path(str(excel_path))
+        try:
+            # calamine can't tell which sheet is active; with several
+            # sheets leave the choice to openpyxl
+            if len(workbook.sheet_names) == 1:
+                sheet = workbook.get_sheet_by_index(0)
+                logger.info("工作表名称: %s (calamine)", sheet.name)
+                logger.info("总行数: %s, 总列数: %s", sheet.height, sheet.width)
+                # Keep leading blank rows/columns so indices match openpyxl
+                for row in sheet.to_python(skip_empty_area=False):
+                    # calamine reports all numbers as float; keep 1 as "1", not "1.0"
+                    yield tuple(
+                        int(v) if isinstance(v, float) and v.is_integer() else v
+                        for v in row
+                    )
+                return
+        finally:
+            workbook.close()
+    
+    # read_only streams rows from the sheet XML instead of loading every cell
+    workbook = load_workbook(excel_path, data_only=True, read_only=True)
+    try:
+        sheet = workbook.active
+        logger.info("工作表名称: %s", sheet.title)
+        # Dimensions may be unknown (None) in read-only mode
+        logger.info("总行数: %s, 总列数: %s", sheet.max_row, sheet.max_column)
+        # values_only=True yields plain tuples without building Cell objects
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
 def parse_excel_clips(excel_path: Path, debug: bool = False) -> list[ClipDefinition]:
     """
     Parse Excel file to extract clip definitions.
@@ -85,146 +153,141 @@ def parse_excel_clips(excel_path: Path, debug: bool = False) -> list[ClipDefinit
     """
     clips = []
     
+    # Below DEBUG the per-row debug calls return before formatting anything
+    logger.setLevel(logging.DEBUG if debug else logging.INFO)
     if debug:
-        logger.setLevel(logging.DEBUG)
-        logger.info(f"开始解析 Excel 文件: {excel_path}")
+        if _console_handler not in logger.handlers:
+            logger.addHandler(_console_handler)
+        logger.info("开始解析 Excel 文件: %s", excel_path)
+    else:
+        # Left attached by an earlier debug parse
+        logger.removeHandler(_console_handler)
     
+    rows = _iter_sheet_rows(excel_path)
     try:
-        workbook = load_workbook(excel_path, data_only=True)
-        sheet = workbook.active
-        
-        logger.info(f"工作表名称: {sheet.title}")
-        logger.info(f"总行数: {sheet.max_row}, 总列数: {sheet.max_column}")
-        
-        # Find column indices
+        # Single pass over the sheet: first row is the header, the rest are data
         header_row = 1
-        time_col = None
-        desc_col = None
+        header = next(rows, None) or ()
+        
+        # Find column indices in a single pass over the header.
+        # Fuzzy matches win; exact matches are the fallback when either
+        # column was not found fuzzily.
+        fuzzy_time = fuzzy_desc = None
+        exact_time = exact_desc = None
         
-        # Log all headers
         if debug:
             logger.debug("=== 表头内容 ===")
-            for col_idx, cell in enumerate(sheet[header_row], start=1):
-                logger.debug(f"  列 {col_idx}: '{cell.value}'")
         
-        for col_idx, cell in enumerate(sheet[header_row], start=1):
-            cell_value = str(cell.value or "").strip()
+        for col_idx, value in enumerate(header, start=1):
+            if debug:
+                logger.debug("  列 %d: '%s'", col_idx, value)
+            
+            cell_value = str(value or "").strip()
             # Match time columns: 起止时间, 起始时间, 开始时间, 时间
-            if "时间" in cell_value and ("起" in cell_value or "止" in cell_value or "开始" in cell_value):
-                time_col = col_idx
-                logger.debug(f"找到时间列 (模糊匹配): 列 {col_idx} = '{cell_value}'")
-            elif "时间" in cell_value and "问题" not in cell_value:
-                # Also match just "时间" if not combined with "问题"
-                time_col = col_idx
-                logger.debug(f"找到时间列 (模糊匹配): 列 {col_idx} = '{cell_value}'")
+            # (also just "时间" if not combined with "问题")
+            if "时间" in cell_value and (
+                "起" in cell_value or "止" in cell_value or "开始" in cell_value
+                or "问题" not in cell_value
+            ):
+                fuzzy_time = col_idx
+                logger.debug("找到时间列 (模糊匹配): 列 %d = '%s'", col_idx, cell_value)
             elif "问题" in cell_value or "描述" in cell_value or "标题" in cell_value:
-                desc_col = col_idx
-                logger.debug(f"找到描述列 (模糊匹配): 列 {col_idx} = '{cell_value}'")
+                fuzzy_desc = col_idx
+                logger.debug("找到描述列 (模糊匹配): 列 %d = '%s'", col_idx, cell_value)
+            
+            # Try common column names in Chinese
+            exact_value = cell_value.lower()
+            if exact_value in _EXACT_TIME_HEADERS:
+                exact_time = col_idx
+            elif exact_value in _EXACT_DESC_HEADERS:
+                exact_desc = col_idx
         
+        time_col, desc_col = fuzzy_time, fuzzy_desc
         if not time_col or not desc_col:
             logger.warning("模糊匹配未找到列，尝试精确匹配...")
-            # Try common column names in Chinese
-            for col_idx, cell in enumerate(sheet[header_row], start=1):
-                cell_value = str(cell.value or "").strip().lower()
-                if cell_value in ["起止时间点", "起止时间", "起始时间点", "起始时间", "开始时间", "时间"]:
-                    time_col = col_idx
-                    logger.debug(f"找到时间列 (精确匹配): 列 {col_idx} = '{cell_value}'")
-                elif cell_value in ["问题描述", "描述", "标题", "片段名称"]:
-                    desc_col = col_idx
-                    logger.debug(f"找到描述列 (精确匹配): 列 {col_idx} = '{cell_value}'")
+            if exact_time:
+                time_col = exact_time
+                logger.debug("找到时间列 (精确匹配): 列 %d = '%s'", time_col, header[time_col - 1])
+            if exact_desc:
+                desc_col = exact_desc
+                logger.debug("找到描述列 (精确匹配): 列 %d = '%s'", desc_col, header[desc_col - 1])
         
         if not time_col or not desc_col:
-            logger.error(f"未找到必需列: time_col={time_col}, desc_col={desc_col}")
+            logger.error("未找到必需列: time_col=%s, desc_col=%s", time_col, desc_col)
             logger.error("请确保表头包含 '起始时间' 和 '问题描述' 相关字段")
-            workbook.close()
             return clips
         
-        logger.info(f"列映射: 时间列={time_col}, 描述列={desc_col}")
-        
-        # Parse data rows
-        import re
+        logger.info("列映射: 时间列=%d, 描述列=%d", time_col, desc_col)
         
-        # Flexible datetime pattern - supports multiple date/time formats
-        # 2026-01-15 10:45:02, 2026/01/15 10:45:02, 2026.01.15 10:45:02, etc.
-        # Also handles: 2026-1-5 10:45:02 (single digit month/day)
-        
-        for row_idx in range(header_row + 1, sheet.max_row + 1):
-            time_cell = sheet.cell(row=row_idx, column=time_col)
-            desc_cell = sheet.cell(row=row_idx, column=desc_col)
+        # Parse data rows. The row count is unknown while streaming, so
+        # bind append locally instead of preallocating.
+        add_clip = clips.append
+        for row_idx, row in enumerate(rows, start=header_row + 1):
+            time_value = row[time_col - 1] if time_col <= len(row) else None
+            desc_value = row[desc_col - 1] if desc_col <= len(row) else None
             
-            time_str = str(time_cell.value or "").strip()
-            desc = str(desc_cell.value or "").strip()
+            time_str = str(time_value or "").strip()
+            desc = str(desc_value or "").strip()
             
             if debug:
-                logger.debug(f"=== 第 {row_idx} 行 ===")
-                logger.debug(f"  时间单元格原始值: {repr(time_cell.value)}")
-                logger.debug(f"  时间字符串(trim后): '{time_str}'")
-                logger.debug(f"  描述: '{desc}'")
+                logger.debug("=== 第 %d 行 ===", row_idx)
+                logger.debug("  时间单元格原始值: %r", time_value)
+                logger.debug("  时间字符串(trim后): '%s'", time_str)
+                logger.debug("  描述: '%s'", desc)
             
             if not time_str or not desc:
                 if debug:
-                    logger.debug(f"  跳过: 时间或描述为空")
+                    logger.debug("  跳过: 时间或描述为空")
                 continue
             
-            # Normalize time string: handle various separators
-            # Handle cases like: "起 xxx 止 xxx", "起 xxx\n止 xxx", "起 xxx\r\n止 xxx", "起 xxx止 xxx"
-            normalized = time_str
-            
-            # Replace common separators before "止" with a single space
-            # Handles: \n止, \r\n止, \r止, "止" directly, " 止"
-            import re as re_module
-            normalized = re_module.sub(r'[\r\n]+', ' ', normalized)  # Replace all line breaks with space
-            normalized = re_module.sub(r'\s+', ' ', normalized)      # Normalize multiple spaces
-            normalized = re_module.sub(r'\s*止\s*', ' 止 ', normalized)  # Ensure "止" has spaces around
+            # Extract start/end datetimes; only the first two matches are used.
+            # _DT_RE already tolerates whitespace, so most strings match as-is.
+            matches = _find_datetimes(time_str)
             
-            if debug and normalized != time_str:
-                logger.debug(f"  规范化后的时间字符串: '{normalized}'")
-            
-            # Extract all datetime patterns - supports multiple formats
-            # 2026-01-15 10:45:02, 2026/01/15 10:45:02, 2026.01.15 10:45:02
-            # Also handles single-digit: 2026-1-5 10:45:02
-            pattern = r'(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})[\s_]+(\d{1,2}):(\d{1,2}):(\d{1,2})'
-            matches = re.findall(pattern, normalized)
+            if len(matches) < 2:
+                # Normalize time string: handle various separators
+                # Handle cases like: "起 xxx 止 xxx", "起 xxx\n止 xxx", "起 xxx\r\n止 xxx", "起 xxx止 xxx"
+                # Line breaks and space runs become one space, "止" gets spaces around
+                normalized = _NORM_RE.sub(_norm_repl, time_str)
+                
+                if normalized != time_str:
+                    if debug:
+                        logger.debug("  规范化后的时间字符串: '%s'", normalized)
+                    matches = _find_datetimes(normalized)
             
             if debug:
-                logger.debug(f"  正则匹配结果: 找到 {len(matches)} 个时间戳")
+                logger.debug("  正则匹配结果: 找到 %d 个时间戳", len(matches))
                 for i, m in enumerate(matches):
-                    logger.debug(f"    时间戳 {i+1}: {m[0]}-{m[1]}-{m[2]} {m[3]}:{m[4]}:{m[5]}")
+                    logger.debug("    时间戳 %d: %s-%s-%s %s:%s:%s", i + 1, *m)
             
             if len(matches) >= 2:
                 try:
-                    start_time = datetime(
-                        int(matches[0][0]), int(matches[0][1]), int(matches[0][2]),
-                        int(matches[0][3]), int(matches[0][4]), int(matches[0][5])
-                    )
-                    end_time = datetime(
-                        int(matches[1][0]), int(matches[1][1]), int(matches[1][2]),
-                        int(matches[1][3]), int(matches[1][4]), int(matches[1][5])
-                    )
+                    start_time = datetime(*map(int, matches[0]))
+                    end_time = datetime(*map(int, matches[1]))
                     
-                    clips.append(ClipDefinition(
+                    add_clip(ClipDefinition(
                         start_time=start_time,
                         end_time=end_time,
                         description=desc
                     ))
-                    logger.info(f"成功解析片段: {desc} ({start_time} ~ {end_time})")
+                    logger.info("成功解析片段: %s (%s ~ %s)", desc, start_time, end_time)
                 except ValueError as ve:
-                    logger.warning(f"第 {row_idx} 行时间解析失败: {ve}")
+                    logger.warning("第 %d 行时间解析失败: %s", row_idx, ve)
                     continue
             else:
-                logger.warning(f"第 {row_idx} 行: 时间格式不匹配，需要 2 个时间戳，找到 {len(matches)} 个")
-                logger.warning(f"  请确保格式类似: '起 2026-01-15 10:45:02 止 2026-01-15 11:30:00'")
+                logger.warning("第 %d 行: 时间格式不匹配，需要 2 个时间戳，找到 %d 个", row_idx, len(matches))
+                logger.warning("  请确保格式类似: '起 2026-01-15 10:45:02 止 2026-01-15 11:30:00'")
                 if debug and len(matches) == 1:
-                    logger.warning(f"  只找到 1 个时间戳，可能缺少结束时间")
+                    logger.warning("  只找到 1 个时间戳，可能缺少结束时间")
                 elif debug and len(matches) == 0:
-                    logger.warning(f"  未找到任何时间戳，请检查日期时间格式是否正确")
-        
-        workbook.close()
+                    logger.warning("  未找到任何时间戳，请检查日期时间格式是否正确")
         
     except Exception as e:
-        logger.error(f"解析 Excel 时出错: {e}")
+        logger.error("解析 Excel 时出错: %s", e)
         import traceback
         logger.error(traceback.format_exc())
+    finally:
+        rows.close()
     
-    logger.info(f"解析完成: 共提取 {len(clips)} 个片段")
+    logger.info("解析完成: 共提取 %d 个片段", len(clips))
     return clips
@@ -1,11 +1,58 @@
 """FFmpeg binary manager - handles bundled or system ffmpeg."""
 import os
 import sys
+import json
 import shutil
 import platform
+import functools
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .utils import get_cache_dir
+
+
+def _detect_platform_name() -> str:
+    """Get platform directory name (windows/macos/linux)."""
+    system = platform.system()
+    if system == "Windows":
+        return "windows"
+    elif system == "Darwin":
+        return "macos"
+    return "linux"
+
+
+# Platform does not change while running, detect once at import
+_PLATFORM_NAME = _detect_platform_name()
+
+# Bundled ffmpeg locations: next to the sources, and inside a PyInstaller bundle
+_FFMPEG_BIN_ROOT = Path(__file__).parent.parent / "ffmpeg_bin"
+_MEIPASS_BIN_ROOT = Path(sys._MEIPASS) / "ffmpeg_bin" if getattr(sys, 'frozen', False) else None
+
+# Explicit binary locations, skip all detection when set
+_FFMPEG_OVERRIDE = os.environ.get("FFMPEG_PATH")
+_FFPROBE_OVERRIDE = os.environ.get("FFPROBE_PATH")
+
+# Versions of successfully probed binaries, reused across launches while the
+# binary's mtime and size are unchanged
+_VERSION_CACHE_FILE = get_cache_dir() / "ffmpeg.json"
+_version_cache_lock = threading.Lock()
+
+# On Windows, hide the console window; on Unix, start a new session to
+# detach from the terminal
+if _PLATFORM_NAME == "windows":
+    _PLATFORM_PROCESS_ARGS = {'creationflags': subprocess.CREATE_NO_WINDOW}
+else:
+    _PLATFORM_PROCESS_ARGS = {'start_new_session': True}
+
+_DEFAULT_SUBPROCESS_ARGS = {
+    'capture_output': True,
+    'text': True,
+    'timeout': 30,
+    **_PLATFORM_PROCESS_ARGS,
+}
+
 
 def get_subprocess_args(**kwargs) -> dict:
     """
@@ -20,77 +67,56 @@ def get_subprocess_args(**kwargs) -> dict:
     Returns:
         Dict of subprocess arguments
     """
-    args = {
-        'capture_output': kwargs.get('capture_output', True),
-        'text': kwargs.get('text', True),
-        'timeout': kwargs.get('timeout', 30),
-    }
-    
-    # On Windows, hide the console window
-    if platform.system() == 'Windows':
-        args['creationflags'] = subprocess.CREATE_NO_WINDOW
-    else:
-        # On Unix, we can use start_new_session to detach from terminal
-        args['start_new_session'] = True
-    
-    # Merge with any additional kwargs
-    for key, value in kwargs.items():
-        if key not in ['capture_output', 'text', 'timeout']:
-            args[key] = value
-    
-    return args
+    # Later keys win, so explicit kwargs override the defaults
+    return {**_DEFAULT_SUBPROCESS_ARGS, **kwargs}
 
 
+@functools.lru_cache(maxsize=1)
 def get_bundled_ffmpeg_dir() -> Path | None:
     """Get the directory containing bundled ffmpeg binaries."""
-    system = platform.system()
-    if system == "Windows":
-        platform_name = "windows"
-    elif system == "Darwin":
-        platform_name = "macos"
-    else:
-        platform_name = "linux"
-    
-    # When running from source
-    source_dir = Path(__file__).parent.parent / "ffmpeg_bin" / platform_name
-    if source_dir.exists():
-        return source_dir
-    
-    # Also check flat structure (ffmpeg_bin directly)
-    flat_dir = Path(__file__).parent.parent / "ffmpeg_bin"
-    if flat_dir.exists():
-        return flat_dir
-    
-    # When running from PyInstaller bundle
-    if getattr(sys, 'frozen', False):
+    # When running from source, then from PyInstaller bundle
+    for bin_root in (_FFMPEG_BIN_ROOT, _MEIPASS_BIN_ROOT):
+        if bin_root is None:
+            continue
+        
+        # One directory read instead of stat-ing each candidate
+        try:
+            with os.scandir(bin_root) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            continue
+        
         # Check platform-specific directory first
-        bundle_dir = Path(sys._MEIPASS) / "ffmpeg_bin" / platform_name
-        if bundle_dir.exists():
-            return bundle_dir
-        # Then check flat structure
-        flat_bundle = Path(sys._MEIPASS) / "ffmpeg_bin"
-        if flat_bundle.exists():
-            return flat_bundle
+        platform_entry = entries.get(_PLATFORM_NAME)
+        if platform_entry is not None and platform_entry.is_dir():
+            return bin_root / _PLATFORM_NAME
+        
+        # Then check flat structure (ffmpeg_bin directly)
+        return bin_root
     
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_ffmpeg_path() -> str:
     """
     Get the path to ffmpeg executable.
     
     Priority:
-    1. Bundled ffmpeg binary
-    2. System ffmpeg in PATH
+    1. FFMPEG_PATH environment variable
+    2. Bundled ffmpeg binary
+    3. System ffmpeg in PATH
     
     Returns:
         Path to ffmpeg executable
     """
+    if _FFMPEG_OVERRIDE:
+        return _FFMPEG_OVERRIDE
+    
     bundled_dir = get_bundled_ffmpeg_dir()
     
     if bundled_dir:
-        system = platform.system()
-        if system == "Windows":
+        if _PLATFORM_NAME == "windows":
             ffmpeg_path = bundled_dir / "ffmpeg.exe"
         else:
             ffmpeg_path = bundled_dir / "ffmpeg"
@@ -98,26 +124,30 @@ def get_ffmpeg_path() -> str:
         if ffmpeg_path.exists():
             return str(ffmpeg_path)
     
-    # Fall back to system ffmpeg
-    return "ffmpeg"
+    # Fall back to system ffmpeg, resolved against PATH once (result is cached)
+    return shutil.which("ffmpeg") or "ffmpeg"
 
 
+@functools.lru_cache(maxsize=1)
 def get_ffprobe_path() -> str:
     """
     Get the path to ffprobe executable.
     
     Priority:
-    1. Bundled ffprobe binary
-    2. System ffprobe in PATH
+    1. FFPROBE_PATH environment variable
+    2. Bundled ffprobe binary
+    3. System ffprobe in PATH
     
     Returns:
         Path to ffprobe executable
     """
+    if _FFPROBE_OVERRIDE:
+        return _FFPROBE_OVERRIDE
+    
     bundled_dir = get_bundled_ffmpeg_dir()
     
     if bundled_dir:
-        system = platform.system()
-        if system == "Windows":
+        if _PLATFORM_NAME == "windows":
             ffprobe_path = bundled_dir / "ffprobe.exe"
         else:
             ffprobe_path = bundled_dir / "ffprobe"
@@ -125,38 +155,145 @@ def get_ffprobe_path() -> str:
         if ffprobe_path.exists():
             return str(ffprobe_path)
     
-    # Fall back to system ffprobe
-    return "ffprobe"
+    # Fall back to system ffprobe, resolved against PATH once (result is cached)
+    return shutil.which("ffprobe") or "ffprobe"
 
 
-def check_ffmpeg() -> tuple[bool, str]:
+def _reset_cache():
+    """Forget cached ffmpeg/ffprobe lookups (e.g. after installing ffmpeg)."""
+    get_bundled_ffmpeg_dir.cache_clear()
+    get_ffmpeg_path.cache_clear()
+    get_ffprobe_path.cache_clear()
+    check_ffmpeg_and_ffprobe.cache_clear()
+    get_hw_h264_encoder.cache_clear()
+
+
+def _is_bundled_binary(path: str) -> bool:
+    """Check whether path is an executable inside the bundled ffmpeg dir."""
+    bundled_dir = get_bundled_ffmpeg_dir()
+    return (
+        bundled_dir is not None
+        and Path(path).parent == bundled_dir
+        and os.access(path, os.X_OK)
+    )
+
+
+def _load_version_cache() -> dict:
+    """Load the on-disk version cache, empty if missing or corrupt."""
+    try:
+        return json.loads(_VERSION_CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def _get_cached_version(name: str, path: str) -> str | None:
+    """Get the cached version line for a binary if it has not changed."""
+    entry = _load_version_cache().get(name)
+    if not isinstance(entry, dict) or entry.get("path") != path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if entry.get("mtime") != stat.st_mtime or entry.get("size") != stat.st_size:
+        return None
+    return entry.get("version")
+
+
+def _store_cached_version(name: str, path: str, version: str):
+    """Remember a successful version probe on disk (best effort)."""
+    try:
+        stat = os.stat(path)
+        with _version_cache_lock:
+            cache = _load_version_cache()
+            cache[name] = {
+                "path": path,
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "version": version,
+            }
+            _VERSION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = _VERSION_CACHE_FILE.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(cache, ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp_file, _VERSION_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _check_version(name: str, path: str, not_found_message: str) -> tuple[bool, str]:
     """
-    Check if ffmpeg is available.
+    Run `<path> -version` to check that a binary is available.
+    
+    Args:
+        name: Binary name for messages (ffmpeg/ffprobe)
+        path: Path to the executable
+        not_found_message: Message returned when the executable is missing
     
     Returns:
         Tuple of (is_available, version_or_error_message)
     """
-    ffmpeg_path = get_ffmpeg_path()
+    # A bundled binary ships with the app; if it is executable there is no
+    # need to pay for a process spawn just to read its version banner
+    if _is_bundled_binary(path):
+        return True, f"bundled: {path}"
+    
+    cached_version = _get_cached_version(name, path)
+    if cached_version is not None:
+        return True, cached_version
     
     try:
+        # Capture bytes; only the parts actually shown get decoded
         result = subprocess.run(
-            [ffmpeg_path, "-version"],
-            **get_subprocess_args(timeout=10)
+            [path, "-version"],
+            **get_subprocess_args(timeout=10, text=False)
         )
         
         if result.returncode == 0:
             # Extract version from first line
-            first_line = result.stdout.split('\n')[0]
+            first_line = result.stdout.split(b'\n', 1)[0].decode('utf-8', errors='replace').rstrip()
+            _store_cached_version(name, path, first_line)
             return True, first_line
         else:
-            return False, f"ffmpeg 执行失败: {result.stderr[:100] if result.stderr else 'Unknown error'}"
+            stderr = result.stderr[:100].decode('utf-8', errors='replace') if result.stderr else 'Unknown error'
+            return False, f"{name} 执行失败: {stderr}"
             
     except FileNotFoundError:
-        return False, "未找到 ffmpeg，请安装 ffmpeg 或使用包含 ffmpeg 的打包版本"
+        return False, not_found_message
     except subprocess.TimeoutExpired:
-        return False, "ffmpeg 响应超时"
+        return False, f"{name} 响应超时"
     except Exception as e:
-        return False, f"检查 ffmpeg 时出错: {str(e)}"
+        return False, f"检查 {name} 时出错: {str(e)}"
+
+
+@functools.lru_cache(maxsize=1)
+def check_ffmpeg_and_ffprobe() -> tuple[tuple[bool, str], tuple[bool, str]]:
+    """
+    Check ffmpeg and ffprobe availability, running both probes concurrently.
+    
+    Returns:
+        Tuple of (ffmpeg_result, ffprobe_result), each being
+        (is_available, version_or_error_message)
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ffmpeg_future = executor.submit(
+            _check_version, "ffmpeg", get_ffmpeg_path(),
+            "未找到 ffmpeg，请安装 ffmpeg 或使用包含 ffmpeg 的打包版本"
+        )
+        ffprobe_future = executor.submit(
+            _check_version, "ffprobe", get_ffprobe_path(),
+            "未找到 ffprobe"
+        )
+        return ffmpeg_future.result(), ffprobe_future.result()
+
+
+def check_ffmpeg() -> tuple[bool, str]:
+    """
+    Check if ffmpeg is available.
+    
+    Returns:
+        Tuple of (is_available, version_or_error_message)
+    """
+    return check_ffmpeg_and_ffprobe()[0]
 
 
 def check_ffprobe() -> tuple[bool, str]:
@@ -166,32 +303,53 @@ def check_ffprobe() -> tuple[bool, str]:
     Returns:
         Tuple of (is_available, version_or_error_message)
     """
-    ffprobe_path = get_ffprobe_path()
+    return check_ffmpeg_and_ffprobe()[1]
+
+
+# Hardware H.264 encoders in order of preference, with the options that
+# stand in for libx264's "-preset medium" (all are given -b:v afterwards)
+HW_H264_ENCODERS = {
+    'h264_nvenc': ['-preset', 'p4', '-rc', 'vbr'],
+    'h264_qsv': ['-preset', 'medium'],
+    'h264_videotoolbox': [],
+    'h264_amf': ['-quality', 'balanced'],
+}
+
+
+@functools.lru_cache(maxsize=1)
+def get_hw_h264_encoder() -> str | None:
+    """
+    Find a hardware H.264 encoder compiled into ffmpeg.
+    
+    A listed encoder may still fail at runtime when the matching GPU or
+    driver is missing, so callers need a libx264 fallback.
     
+    Returns:
+        Encoder name from HW_H264_ENCODERS, or None if there is none
+    """
     try:
         result = subprocess.run(
-            [ffprobe_path, "-version"],
+            [get_ffmpeg_path(), '-hide_banner', '-encoders'],
             **get_subprocess_args(timeout=10)
         )
-        
-        if result.returncode == 0:
-            first_line = result.stdout.split('\n')[0]
-            return True, first_line
-        else:
-            return False, f"ffprobe 执行失败: {result.stderr[:100] if result.stderr else 'Unknown error'}"
-            
-    except FileNotFoundError:
-        return False, "未找到 ffprobe"
-    except subprocess.TimeoutExpired:
-        return False, "ffprobe 响应超时"
-    except Exception as e:
-        return False, f"检查 ffprobe 时出错: {str(e)}"
+    except (OSError, subprocess.SubprocessError):
+        return None
+    
+    # Lines look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+    available = {fields[1] for fields in map(str.split, result.stdout.splitlines()) if len(fields) > 1}
+    for encoder in HW_H264_ENCODERS:
+        if encoder in available:
+            return encoder
+    return None
 
 
 def download_ffmpeg(target_dir: Path, platform_name: str | None = None) -> bool:
     """
     Download ffmpeg binaries for the current platform.
     
+    The archive is streamed to a temporary file in 1 MiB chunks and only
+    the ffmpeg/ffprobe members are extracted from it.
+    
     Args:
         target_dir: Directory to save ffmpeg binaries
         platform_name: Override platform detection (windows/macos/linux)
@@ -199,18 +357,13 @@ def download_ffmpeg(target_dir: Path, platform_name: str | None = None) -> bool:
     Returns:
         True if download successful
     """
+    import tempfile
     import urllib.request
     import zipfile
     import tarfile
     
     if platform_name is None:
-        system = platform.system()
-        if system == "Windows":
-            platform_name = "windows"
-        elif system == "Darwin":
-            platform_name = "macos"
-        else:
-            platform_name = "linux"
+        platform_name = _PLATFORM_NAME
     
     # FFmpeg download URLs (using github releases or official builds)
     urls = {
@@ -225,17 +378,65 @@ def download_ffmpeg(target_dir: Path, platform_name: str | None = None) -> bool:
     
     target_dir.mkdir(parents=True, exist_ok=True)
     
+    if platform_name == "macos":
+        # macOS builds are 7z archives, which the standard library cannot read
+        print("Note: Please download ffmpeg manually for now.")
+        print(f"Place ffmpeg and ffprobe binaries in: {target_dir}")
+        return False
+    
     print(f"Downloading ffmpeg for {platform_name}...")
     
-    # This is a placeholder - actual implementation would need to:
-    # 1. Download the archive
-    # 2. Extract ffmpeg and ffprobe binaries
-    # 3. Set executable permissions on Unix
+    if platform_name == "windows":
+        remaining = {"ffmpeg.exe", "ffprobe.exe"}
+    else:
+        remaining = {"ffmpeg", "ffprobe"}
+    
+    def save_member(name: str, source):
+        with open(target_dir / name, 'wb') as f:
+            shutil.copyfileobj(source, f, 1 << 20)
+        remaining.discard(name)
+    
+    try:
+        with urllib.request.urlopen(urls[platform_name], timeout=60) as response, \
+                tempfile.TemporaryFile() as archive:
+            shutil.copyfileobj(response, archive, 1 << 20)
+            archive.seek(0)
+            
+            # Extract only ffmpeg and ffprobe, stop once both are written
+            if platform_name == "windows":
+                with zipfile.ZipFile(archive) as zf:
+                    for info in zf.infolist():
+                        name = info.filename.rsplit('/', 1)[-1]
+                        if name in remaining:
+                            with zf.open(info) as source:
+                                save_member(name, source)
+                            if not remaining:
+                                break
+            else:
+                with tarfile.open(fileobj=archive, mode='r:xz') as tf:
+                    for member in tf:
+                        name = member.name.rsplit('/', 1)[-1]
+                        if member.isfile() and name in remaining:
+                            save_member(name, tf.extractfile(member))
+                            if not remaining:
+                                break
+    except Exception as e:
+        print(f"Download failed: {e}")
+        return False
+    
+    if remaining:
+        print(f"Missing from archive: {', '.join(sorted(remaining))}")
+        return False
     
-    print("Note: Please download ffmpeg manually for now.")
-    print(f"Place ffmpeg and ffprobe binaries in: {target_dir}")
+    # Set executable permissions on Unix
+    if platform_name != "windows":
+        (target_dir / "ffmpeg").chmod(0o755)
+        (target_dir / "ffprobe").chmod(0o755)
     
-    return False
+    # Lookups cached before the download would miss the new binaries
+    _reset_cache()
+    print(f"ffmpeg binaries saved to: {target_dir}")
+    return True
 
 
 if __name__ == "__main__":
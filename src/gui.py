@@ -1,9 +1,13 @@
 """Main GUI for Video Cutter application."""
 import sys
 import logging
+import time
+import platform
 import threading
 import traceback
-from datetime import datetime, timedelta
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, qInstallMessageHandler
@@ -16,10 +20,13 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QAction, QIcon
 
 from .excel_parser import parse_excel_clips, ClipDefinition
-from .video_processor import VideoProcessor, VideoInfo, ClipTask, QualitySettings, OffsetSettings
-from .utils import parse_video_filename, get_video_files
-from .ffmpeg_manager import check_ffmpeg, check_ffprobe, get_ffmpeg_path, get_ffprobe_path
-from .logger import get_logger, log_exception
+from .video_processor import (
+    VideoProcessor, VideoInfo, ClipTask, QualitySettings, OffsetSettings,
+    get_video_infos, sort_videos
+)
+from .utils import parse_video_filenames, get_video_files
+from .ffmpeg_manager import check_ffmpeg_and_ffprobe, get_ffmpeg_path
+from .logger import get_logger, log_exception, shutdown_logging
 
 
 # Install Qt message handler to capture Qt logs
@@ -62,10 +69,14 @@ def thread_exception_hook(args):
 threading.excepthook = thread_exception_hook
 
 
+# Worker signals are always delivered through the GUI thread's event queue.
+# Progress is not a signal at all; the display timer polls it.
+_QUEUED = Qt.ConnectionType.QueuedConnection
+
+
 class WorkerThread(QThread):
     """Worker thread for video processing."""
     
-    progress_updated = pyqtSignal(float)
     log_message = pyqtSignal(str)
     task_completed = pyqtSignal(str, bool)  # description, success
     all_completed = pyqtSignal()
@@ -84,98 +95,41 @@ class WorkerThread(QThread):
         self.quality = quality
         self.video_infos = video_infos
         self.offset = offset or OffsetSettings.default()
-        self._running = True
-        self._paused = False
-        self.current_task: ClipTask | None = None  # Track current task for progress display
+        # Set while running, cleared while paused
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._stop_event = threading.Event()
+        # Tasks currently being cut, polled by the GUI timer for progress
+        self._active_tasks: dict[int, ClipTask] = {}
+        self._active_lock = threading.Lock()
     
     def run(self):
-        """Process all tasks."""
-        from .logger import get_logger
+        """Process all tasks, up to processor.PARALLEL_CLIPS at a time."""
         logger = get_logger()
         logger.info(f"WorkerThread started with {len(self.tasks)} tasks")
         logger.info(f"Available videos: {len(self.video_infos)}")
         
         try:
-            # Assign video info to each task
-            for i, task in enumerate(self.tasks):
-                logger.info(f"Processing task {i+1}/{len(self.tasks)}: {task.description}")
-                
-                # Set current task for progress tracking
-                self.current_task = task
-                
-                if not self._running:
-                    logger.info("Worker stopped, exiting loop")
-                    break
-                
-                # Resume from paused state
-                while self._paused and self._running:
-                    import time
-                    time.sleep(0.1)
-                
-                if not self._running:
-                    logger.info("Worker stopped during pause, exiting")
-                    break
-                
-                try:
-                    # Apply offset to clip times
-                    adjusted_start, adjusted_end = self.processor.apply_time_offset(
-                        task.clip_start, task.clip_end, self.offset
-                    )
-                    
-                    logger.debug(f"Original times: {task.clip_start} ~ {task.clip_end}")
-                    logger.debug(f"Adjusted times: {adjusted_start} ~ {adjusted_end}")
-                    
-                    # Update task with adjusted times
-                    original_duration = (task.clip_end - task.clip_start).total_seconds()
-                    new_duration = (adjusted_end - adjusted_start).total_seconds()
-                    if new_duration != original_duration:
-                        self.log_message.emit(f"时间偏移: {task.description} ({original_duration:.1f}s → {new_duration:.1f}s)")
-                    
-                    task.clip_start = adjusted_start
-                    task.clip_end = adjusted_end
-                    
-                    # Find source video for this task
-                    logger.debug(f"Finding video for clip {task.clip_start} ~ {task.clip_end}")
-                    task.video_info = self.processor.find_video_for_clip(
-                        self.video_infos, task.clip_start, task.clip_end
+            # Sort once so each task's video lookup is a bisect
+            video_infos, video_starts, max_ends = sort_videos(self.video_infos)
+            
+            # Tasks write distinct output files (made unique in
+            # start_processing), so they can run side by side; the pool
+            # keeps at most PARALLEL_CLIPS ffmpeg processes
+            max_workers = self.processor.PARALLEL_CLIPS
+            logger.info(f"Running up to {max_workers} clips in parallel")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for i, task in enumerate(self.tasks):
+                    executor.submit(
+                        self._run_task, i, task, video_infos, video_starts, max_ends
                     )
-                    
-                    if task.video_info:
-                        logger.info(f"Found video: {task.video_info.path.name}")
-                        self.log_message.emit(f"处理: {task.description} (源: {task.video_info.path.name})")
-                        
-                        success = self.processor.cut_clip(
-                            task, self.quality,
-                            progress_callback=lambda p: self.progress_updated.emit(p),
-                            log_callback=lambda msg: self.log_message.emit(msg)
-                        )
-                        
-                        logger.info(f"cut_clip returned: {success}, task.status: {task.status}")
-                        self.task_completed.emit(task.description, task.status == "completed")
-                    else:
-                        logger.warning(f"No video found for task: {task.description}")
-                        task.status = "failed"
-                        task.error = "找不到源视频"
-                        self.log_message.emit(f"失败: {task.description} - 找不到匹配的源视频")
-                        self.log_message.emit(f"  片段时间: {task.clip_start} ~ {task.clip_end}")
-                        self.task_completed.emit(task.description, False)
-                        
-                except Exception as e:
-                    import traceback
-                    logger.error(f"Task exception: {str(e)}")
-                    logger.debug(traceback.format_exc())
-                    task.status = "failed"
-                    task.error = str(e)
-                    self.log_message.emit(f"异常: {task.description} - {str(e)}")
-                    self.log_message.emit(traceback.format_exc())
-                    self.task_completed.emit(task.description, False)
             
-            logger.info(f"Worker loop completed, running={self._running}")
-            if self._running:
+            running = not self._stop_event.is_set()
+            logger.info(f"Worker loop completed, running={running}")
+            if running:
                 self.all_completed.emit()
                 
         except Exception as e:
-            import traceback
             logger.error(f"Worker critical error: {str(e)}")
             logger.debug(traceback.format_exc())
             self.log_message.emit(f"严重错误: {str(e)}")
@@ -184,20 +138,177 @@ class WorkerThread(QThread):
         finally:
             logger.info("WorkerThread run() finished - finally block")
     
+    def _run_task(
+        self,
+        index: int,
+        task: ClipTask,
+        video_infos: list[VideoInfo],
+        video_starts: list,
+        max_ends: list
+    ):
+        """Process one task on a pool thread."""
+        logger = get_logger()
+        
+        if self._stop_event.is_set():
+            return
+        
+        # Block while paused; stop() also sets the event to wake us
+        self._resume_event.wait()
+        
+        if self._stop_event.is_set():
+            logger.info(f"Worker stopped, skipping task: {task.description}")
+            return
+        
+        logger.info(f"Processing task {index+1}/{len(self.tasks)}: {task.description}")
+        
+        # Track the task for progress display
+        with self._active_lock:
+            self._active_tasks[id(task)] = task
+        
+        try:
+            # Apply offset to clip times
+            adjusted_start, adjusted_end = self.processor.apply_time_offset(
+                task.clip_start, task.clip_end, self.offset
+            )
+            
+            logger.debug(f"Original times: {task.clip_start} ~ {task.clip_end}")
+            logger.debug(f"Adjusted times: {adjusted_start} ~ {adjusted_end}")
+            
+            # Update task with adjusted times
+            original_duration = (task.clip_end - task.clip_start).total_seconds()
+            new_duration = (adjusted_end - adjusted_start).total_seconds()
+            if new_duration != original_duration:
+                self.log_message.emit(f"时间偏移: {task.description} ({original_duration:.1f}s → {new_duration:.1f}s)")
+            
+            task.clip_start = adjusted_start
+            task.clip_end = adjusted_end
+            
+            # Find source video for this task
+            logger.debug(f"Finding video for clip {task.clip_start} ~ {task.clip_end}")
+            task.video_info = self.processor.find_video_for_clip(
+                video_infos, task.clip_start, task.clip_end, video_starts, max_ends
+            )
+            
+            if task.video_info:
+                logger.info(f"Found video: {task.video_info.path.name}")
+                self.log_message.emit(f"处理: {task.description} (源: {task.video_info.path.name})")
+                
+                success = self.processor.cut_clip(
+                    task, self.quality,
+                    log_callback=self.log_message.emit
+                )
+                
+                logger.info(f"cut_clip returned: {success}, task.status: {task.status}")
+                self._finish_task(task)
+                self.task_completed.emit(task.description, task.status == "completed")
+            else:
+                logger.warning(f"No video found for task: {task.description}")
+                task.status = "failed"
+                task.error = "找不到源视频"
+                self.log_message.emit(f"失败: {task.description} - 找不到匹配的源视频")
+                self.log_message.emit(f"  片段时间: {task.clip_start} ~ {task.clip_end}")
+                self._finish_task(task)
+                self.task_completed.emit(task.description, False)
+                
+        except Exception as e:
+            logger.error(f"Task exception: {str(e)}")
+            logger.debug(traceback.format_exc())
+            task.status = "failed"
+            task.error = str(e)
+            self.log_message.emit(f"异常: {task.description} - {str(e)}")
+            self.log_message.emit(traceback.format_exc())
+            self._finish_task(task)
+            self.task_completed.emit(task.description, False)
+    
+    def _finish_task(self, task: ClipTask):
+        """Stop tracking a task's progress (safe to call more than once)."""
+        with self._active_lock:
+            self._active_tasks.pop(id(task), None)
+    
+    def active_tasks(self) -> list[ClipTask]:
+        """Snapshot of the tasks currently being cut."""
+        with self._active_lock:
+            return list(self._active_tasks.values())
+    
+    def is_paused(self) -> bool:
+        """Check whether processing is paused."""
+        return not self._resume_event.is_set()
+    
     def pause(self):
         """Pause processing."""
-        self._paused = True
+        self._resume_event.clear()
     
     def resume(self):
         """Resume processing."""
-        self._paused = False
+        self._resume_event.set()
     
     def stop(self):
         """Stop processing."""
-        self._running = False
+        self._stop_event.set()
+        self._resume_event.set()  # Wake paused tasks so they can exit
         self.processor.stop()
 
 
+class VideoScanThread(QThread):
+    """Background thread that reads video info for a folder of videos."""
+    
+    log_message = pyqtSignal(str)
+    scan_completed = pyqtSignal(list)  # list[VideoInfo]
+    
+    def __init__(self, videos: list[Path]):
+        super().__init__()
+        self.videos = videos
+    
+    def run(self):
+        """Probe all videos and emit the collected infos."""
+        video_infos = []
+        
+        # Parse all filename timestamps up front. Files without one can't be
+        # matched to clips, so they are never handed to ffprobe.
+        start_times = parse_video_filenames(video_path.name for video_path in self.videos)
+        probe_paths = [p for p, t in zip(self.videos, start_times) if t]
+        probe_starts = [t for t in start_times if t]
+        
+        # Probed in parallel, results arrive in file order
+        results = get_video_infos(probe_paths, probe_starts)
+        
+        for video_path, start_time in zip(self.videos, start_times):
+            if not start_time:
+                self.log_message.emit(f"  ✗ {video_path.name} (无法解析文件名时间)")
+                continue
+            
+            info = next(results)
+            if info:
+                self.log_message.emit(f"  ✓ {video_path.name} (时长: {info.duration:.1f}s)")
+                video_infos.append(info)
+                continue
+            
+            # Create basic info from filename
+            video_infos.append(VideoInfo(
+                path=video_path,
+                start_time=start_time,
+                duration=0,  # Unknown
+                width=0, height=0, bitrate=0, fps=0
+            ))
+            self.log_message.emit(f"  ✓ {video_path.name} (开始: {start_time}, 时长: 未知)")
+        
+        self.scan_completed.emit(video_infos)
+
+
+class ExcelParseThread(QThread):
+    """Background thread that parses clip definitions from an Excel file."""
+    
+    parse_completed = pyqtSignal(list)  # list[ClipDefinition]
+    
+    def __init__(self, excel_path: Path):
+        super().__init__()
+        self.excel_path = excel_path
+    
+    def run(self):
+        """Parse the Excel file with debug logging."""
+        self.parse_completed.emit(parse_excel_clips(self.excel_path, debug=True))
+
+
 class VideoCutterWindow(QMainWindow):
     """Main application window."""
     
@@ -220,11 +331,20 @@ class VideoCutterWindow(QMainWindow):
         self.video_infos: list[VideoInfo] = []
         self.clip_definitions: list[ClipDefinition] = []
         self.clip_tasks: list[ClipTask] = []
+        self._row_by_description: dict[str, int] = {}  # Task table row lookup
         
         # Processing
         self.processor = VideoProcessor()
         self.worker: WorkerThread | None = None
-        self.start_time: datetime | None = None
+        self.scan_thread: VideoScanThread | None = None
+        self.excel_thread: ExcelParseThread | None = None
+        self.start_time: float | None = None  # time.monotonic() at start
+        
+        # Progress display state, so timer ticks without changes do nothing
+        self._progress_dirty = False
+        self._polled_progress: dict[str, float] = {}
+        self._last_overall_pct = -1
+        self._last_remaining_str = ""
         self.total_clips = 0
         self.completed_clips = 0
         self.failed_clips = 0
@@ -233,9 +353,6 @@ class VideoCutterWindow(QMainWindow):
     
     def _set_window_icon(self):
         """Set the application window icon."""
-        from pathlib import Path
-        import platform
-        
         # Choose icon format based on platform
         system = platform.system()
         if system == "Darwin":
@@ -263,9 +380,7 @@ class VideoCutterWindow(QMainWindow):
     
     def check_ffmpeg_availability(self):
         """Check if ffmpeg is available and show warning if not."""
-        ffmpeg_ok, ffmpeg_msg = check_ffmpeg()
-        ffprobe_ok, ffprobe_msg = check_ffprobe()
-        
+        (ffmpeg_ok, ffmpeg_msg), (ffprobe_ok, ffprobe_msg) = check_ffmpeg_and_ffprobe()
         if not ffmpeg_ok or not ffprobe_ok:
             msg = "视频处理工具未正确配置:\n\n"
             if not ffmpeg_ok:
@@ -277,6 +392,7 @@ class VideoCutterWindow(QMainWindow):
             QMessageBox.warning(self, "依赖缺失", msg)
             self.statusBar().showMessage("警告: ffmpeg 不可用")
         else:
+            # Cached lookup, shared with every ffmpeg run of the processor
             self.statusBar().showMessage(f"就绪 (ffmpeg: {get_ffmpeg_path()})")
     
     def setup_ui(self):
@@ -349,6 +465,7 @@ class VideoCutterWindow(QMainWindow):
         quality_layout.addWidget(QLabel("输出质量:"))
         self.quality_combo = QComboBox()
         self.quality_combo.addItem("高质量 (原码率)", QualitySettings.high())
+        self.quality_combo.addItem("原始画质 (不转码, 最快)", QualitySettings.stream_copy())
         self.quality_combo.addItem("中等质量 (50%码率)", QualitySettings.medium())
         self.quality_combo.addItem("低质量 (30%码率)", QualitySettings.low())
         quality_layout.addWidget(self.quality_combo)
@@ -474,8 +591,17 @@ class VideoCutterWindow(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setMaximumHeight(120)
         self.log_text.setReadOnly(True)
+        # Old lines are dropped once the log grows past this many lines
+        self.log_text.document().setMaximumBlockCount(5000)
         log_layout.addWidget(self.log_text)
         
+        # Log lines are buffered and appended in batches, one document
+        # layout per flush instead of one per message
+        self._log_buffer: deque[str] = deque(maxlen=2000)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_timer.start(150)
+        
         log_group.setLayout(log_layout)
         main_layout.addWidget(log_group)
     
@@ -504,13 +630,22 @@ class VideoCutterWindow(QMainWindow):
     
     def log(self, message: str, level: str = 'INFO'):
         """Add message to log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        timestamp = time.strftime("%H:%M:%S")
+        self._log_buffer.append(f"[{timestamp}] {message}")
         self.statusBar().showMessage(message)
         
         # Also write to file
         self.logger.log(getattr(logging, level, logging.INFO), message)
     
+    def _flush_log(self):
+        """Append buffered log lines to the log view in one update."""
+        if not self._log_buffer:
+            return
+        
+        lines = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        self.log_text.append(lines)
+    
     def select_video_folder(self):
         """Select source video folder."""
         folder = QFileDialog.getExistingDirectory(
@@ -526,42 +661,17 @@ class VideoCutterWindow(QMainWindow):
             videos = get_video_files(self.video_folder)
             
             if videos:
-                # Get video info for each file
+                # Get video info for each file in the background (requires ffprobe)
                 self.video_infos = []
                 self.log(f"正在扫描 {len(videos)} 个视频文件...")
+                self.video_count_label.setText("正在扫描视频文件...")
+                self.video_count_label.setStyleSheet("color: #666;")
+                self.video_btn.setEnabled(False)
                 
-                for video_path in videos:
-                    info = None
-                    # Try to get video info (requires ffprobe)
-                    try:
-                        from .video_processor import get_video_info
-                        info = get_video_info(video_path)
-                        if info:
-                            self.log(f"  ✓ {video_path.name} (时长: {info.duration:.1f}s)")
-                    except Exception as e:
-                        self.log(f"  ⚠ {video_path.name} (获取信息失败: {e})")
-                    
-                    if info:
-                        self.video_infos.append(info)
-                    else:
-                        # Create basic info from filename
-                        start_time = parse_video_filename(video_path.name)
-                        if start_time:
-                            self.video_infos.append(VideoInfo(
-                                path=video_path,
-                                start_time=start_time,
-                                duration=0,  # Unknown
-                                width=0, height=0, bitrate=0, fps=0
-                            ))
-                            self.log(f"  ✓ {video_path.name} (开始: {start_time}, 时长: 未知)")
-                        else:
-                            self.log(f"  ✗ {video_path.name} (无法解析文件名时间)")
-                
-                count = len(self.video_infos)
-                self.video_count_label.setText(f"发现 {count} 个视频文件")
-                self.video_count_label.setStyleSheet("color: green;")
-                
-                self.log(f"已加载 {count} 个视频文件")
+                self.scan_thread = VideoScanThread(videos)
+                self.scan_thread.log_message.connect(self.on_log_message, _QUEUED)
+                self.scan_thread.scan_completed.connect(self.on_video_scan_completed, _QUEUED)
+                self.scan_thread.start()
             else:
                 self.video_count_label.setText("文件夹中没有找到视频文件")
                 self.video_count_label.setStyleSheet("color: red;")
@@ -569,6 +679,19 @@ class VideoCutterWindow(QMainWindow):
             
             self.update_start_button()
     
+    def on_video_scan_completed(self, video_infos: list[VideoInfo]):
+        """Handle video scan results from the scan thread."""
+        self.video_infos = video_infos
+        
+        count = len(self.video_infos)
+        self.video_count_label.setText(f"发现 {count} 个视频文件")
+        self.video_count_label.setStyleSheet("color: green;")
+        
+        self.log(f"已加载 {count} 个视频文件")
+        
+        self.video_btn.setEnabled(True)
+        self.update_start_button()
+    
     def select_excel_file(self):
         """Select Excel file with clip definitions."""
         file, _ = QFileDialog.getOpenFileName(
@@ -581,26 +704,39 @@ class VideoCutterWindow(QMainWindow):
             self.excel_path = Path(file)
             self.excel_path_edit.setText(str(self.excel_path))
             
-            # Parse Excel with debug logging
+            # Parse Excel in the background so the window stays responsive
             self.log("正在解析 Excel 文件...")
-            self.clip_definitions = parse_excel_clips(self.excel_path, debug=True)
+            self.clip_definitions = []
+            self.clip_count_label.setText("正在解析 Excel 表格...")
+            self.clip_count_label.setStyleSheet("color: #666;")
+            self.excel_btn.setEnabled(False)
+            self.update_start_button()
             
-            if self.clip_definitions:
-                count = len(self.clip_definitions)
-                self.clip_count_label.setText(f"待剪切 {count} 个片段")
-                self.clip_count_label.setStyleSheet("color: green;")
-                
-                self.log(f"✓ 已加载 {count} 个片段")
-                
-                # Update task table
-                self.update_task_table()
-            else:
-                self.clip_count_label.setText("未能解析到片段信息")
-                self.clip_count_label.setStyleSheet("color: red;")
-                self.clip_definitions = []
-                self.log("✗ 解析失败，请查看上方日志了解原因")
+            self.excel_thread = ExcelParseThread(self.excel_path)
+            self.excel_thread.parse_completed.connect(self.on_excel_parse_completed, _QUEUED)
+            self.excel_thread.start()
+    
+    def on_excel_parse_completed(self, clip_definitions: list[ClipDefinition]):
+        """Handle parsed clip definitions from the Excel thread."""
+        self.clip_definitions = clip_definitions
+        
+        if self.clip_definitions:
+            count = len(self.clip_definitions)
+            self.clip_count_label.setText(f"待剪切 {count} 个片段")
+            self.clip_count_label.setStyleSheet("color: green;")
             
-            self.update_start_button()
+            self.log(f"✓ 已加载 {count} 个片段")
+            
+            # Update task table
+            self.update_task_table()
+        else:
+            self.clip_count_label.setText("未能解析到片段信息")
+            self.clip_count_label.setStyleSheet("color: red;")
+            self.clip_definitions = []
+            self.log("✗ 解析失败，请查看上方日志了解原因")
+        
+        self.excel_btn.setEnabled(True)
+        self.update_start_button()
     
     def select_output_folder(self):
         """Select output folder."""
@@ -613,23 +749,39 @@ class VideoCutterWindow(QMainWindow):
             self.output_folder = Path(folder)
             self.output_path_edit.setText(str(self.output_folder))
     
+    @contextmanager
+    def _bulk_table_update(self):
+        """Suspend task table repaints and item signals during bulk edits."""
+        self.task_table.setUpdatesEnabled(False)
+        self.task_table.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.task_table.blockSignals(False)
+            self.task_table.setUpdatesEnabled(True)
+    
     def update_task_table(self):
         """Update task table with clip definitions."""
-        self.task_table.setRowCount(len(self.clip_definitions))
-        
-        for row, clip in enumerate(self.clip_definitions):
-            # Task name
-            self.task_table.setItem(row, 0, QTableWidgetItem(clip.description))
-            
-            # Status
-            status_item = QTableWidgetItem("等待")
-            status_item.setData(Qt.ItemDataRole.UserRole, "pending")
-            self.task_table.setItem(row, 1, status_item)
+        with self._bulk_table_update():
+            self.task_table.setRowCount(len(self.clip_definitions))
+            self._row_by_description.clear()
             
-            # Progress
-            progress_item = QTableWidgetItem("0%")
-            progress_item.setData(Qt.ItemDataRole.UserRole, 0.0)
-            self.task_table.setItem(row, 2, progress_item)
+            for row, clip in enumerate(self.clip_definitions):
+                # Task name
+                self.task_table.setItem(row, 0, QTableWidgetItem(clip.description))
+                
+                # Status
+                status_item = QTableWidgetItem("等待")
+                status_item.setData(Qt.ItemDataRole.UserRole, "pending")
+                self.task_table.setItem(row, 1, status_item)
+                
+                # Progress
+                progress_item = QTableWidgetItem("0%")
+                progress_item.setData(Qt.ItemDataRole.UserRole, 0.0)
+                self.task_table.setItem(row, 2, progress_item)
+                
+                # Duplicate descriptions map to the first row, as the old scan did
+                self._row_by_description.setdefault(clip.description, row)
     
     def update_start_button(self):
         """Update start button enabled state."""
@@ -646,14 +798,24 @@ class VideoCutterWindow(QMainWindow):
         if not self.output_folder:
             self.output_folder = self.video_folder
         
-        # Create clip tasks
+        # Create clip tasks. Tasks run in parallel, so rows with the same
+        # description get "_2", "_3"... instead of sharing one output file
+        # (compared case-insensitively, as on Windows/macOS filesystems).
         self.clip_tasks = []
+        used_names = set()
         for clip in self.clip_definitions:
+            filename = clip.get_output_filename()
+            stem, suffix = Path(filename).stem, Path(filename).suffix
+            n = 1
+            while filename.lower() in used_names:
+                n += 1
+                filename = f"{stem}_{n}{suffix}"
+            used_names.add(filename.lower())
             task = ClipTask(
                 clip_start=clip.start_time,
                 clip_end=clip.end_time,
                 description=clip.description,
-                output_path=self.output_folder / clip.get_output_filename()
+                output_path=self.output_folder / filename
             )
             self.clip_tasks.append(task)
         
@@ -671,7 +833,11 @@ class VideoCutterWindow(QMainWindow):
         self.total_clips = len(self.clip_tasks)
         self.completed_clips = 0
         self.failed_clips = 0
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
+        self._progress_dirty = True
+        self._polled_progress = {}
+        self._last_overall_pct = -1
+        self._last_remaining_str = ""
         
         # Reset processor state (important for restart after stop)
         self.processor.reset()
@@ -683,11 +849,14 @@ class VideoCutterWindow(QMainWindow):
             self.logger.info(f"  Video: {vi.path.name}, start={vi.start_time}, duration={vi.duration}s")
         
         # Update task table
-        for row in range(self.task_table.rowCount()):
-            self.task_table.item(row, 1).setText("等待")
-            self.task_table.item(row, 1).setData(Qt.ItemDataRole.UserRole, "pending")
-            self.task_table.item(row, 2).setText("0%")
-            self.task_table.item(row, 2).setData(Qt.ItemDataRole.UserRole, 0.0)
+        with self._bulk_table_update():
+            for row in range(self.task_table.rowCount()):
+                status_item = self.task_table.item(row, 1)
+                status_item.setText("等待")
+                status_item.setData(Qt.ItemDataRole.UserRole, "pending")
+                progress_item = self.task_table.item(row, 2)
+                progress_item.setText("0%")
+                progress_item.setData(Qt.ItemDataRole.UserRole, 0.0)
         
         # Disable controls
         self.video_btn.setEnabled(False)
@@ -701,10 +870,9 @@ class VideoCutterWindow(QMainWindow):
         self.worker = WorkerThread(
             self.processor, self.clip_tasks, quality, self.video_infos, offset
         )
-        self.worker.progress_updated.connect(self.on_progress_updated)
-        self.worker.log_message.connect(self.on_log_message)
-        self.worker.task_completed.connect(self.on_task_completed)
-        self.worker.all_completed.connect(self.on_all_completed)
+        self.worker.log_message.connect(self.on_log_message, _QUEUED)
+        self.worker.task_completed.connect(self.on_task_completed, _QUEUED)
+        self.worker.all_completed.connect(self.on_all_completed, _QUEUED)
         self.worker.start()
         
         # Update progress timer
@@ -717,7 +885,7 @@ class VideoCutterWindow(QMainWindow):
     def toggle_pause(self):
         """Toggle pause/resume."""
         if self.worker and self.worker.isRunning():
-            if self.worker._paused:
+            if self.worker.is_paused():
                 self.worker.resume()
                 self.processor.resume()
                 self.pause_btn.setText("暂停")
@@ -754,20 +922,16 @@ class VideoCutterWindow(QMainWindow):
                 if self.update_progress_timer:
                     self.update_progress_timer.stop()
     
-    def on_progress_updated(self, progress: float):
-        """Handle progress update from worker."""
+    def on_progress_updated(self, task: ClipTask, progress: float):
+        """Show the latest progress of a running task."""
         try:
-            # Update current task progress in table
-            if self.worker and hasattr(self.worker, 'current_task') and self.worker.current_task:
-                task = self.worker.current_task
-                task.progress = progress
-                
-                # Find row in table
-                for row in range(self.task_table.rowCount()):
-                    if self.task_table.item(row, 0).text() == task.description:
-                        self.task_table.item(row, 2).setText(f"{int(progress * 100)}%")
-                        self.task_table.item(row, 2).setData(Qt.ItemDataRole.UserRole, progress)
-                        break
+            # Update task progress in table
+            self._progress_dirty = True
+            
+            row = self._row_by_description.get(task.description)
+            if row is not None:
+                self.task_table.item(row, 2).setText(f"{int(progress * 100)}%")
+                self.task_table.item(row, 2).setData(Qt.ItemDataRole.UserRole, progress)
         except Exception as e:
             self.logger.error(f"on_progress_updated error: {e}")
     
@@ -777,20 +941,26 @@ class VideoCutterWindow(QMainWindow):
     
     def on_task_completed(self, description: str, success: bool):
         """Handle task completion."""
-        # Find and update row
-        for row in range(self.task_table.rowCount()):
-            if self.task_table.item(row, 0).text() == description:
-                if success:
-                    self.task_table.item(row, 1).setText("完成")
-                    self.task_table.item(row, 1).setData(Qt.ItemDataRole.UserRole, "completed")
-                    self.task_table.item(row, 1).setForeground(Qt.GlobalColor.darkGreen)
-                    self.completed_clips += 1
-                else:
-                    self.task_table.item(row, 1).setText("失败")
-                    self.task_table.item(row, 1).setData(Qt.ItemDataRole.UserRole, "failed")
-                    self.task_table.item(row, 1).setForeground(Qt.GlobalColor.red)
-                    self.failed_clips += 1
-                break
+        self._progress_dirty = True
+        
+        row = self._row_by_description.get(description)
+        if row is None:
+            return
+        
+        status_item = self.task_table.item(row, 1)
+        if success:
+            status_item.setText("完成")
+            status_item.setData(Qt.ItemDataRole.UserRole, "completed")
+            status_item.setForeground(Qt.GlobalColor.darkGreen)
+            # Progress is polled, so the last tick may have missed the final value
+            self.task_table.item(row, 2).setText("100%")
+            self.task_table.item(row, 2).setData(Qt.ItemDataRole.UserRole, 1.0)
+            self.completed_clips += 1
+        else:
+            status_item.setText("失败")
+            status_item.setData(Qt.ItemDataRole.UserRole, "failed")
+            status_item.setForeground(Qt.GlobalColor.red)
+            self.failed_clips += 1
     
     def on_all_completed(self):
         """Handle all tasks completed."""
@@ -817,23 +987,35 @@ class VideoCutterWindow(QMainWindow):
         if not self.start_time:
             return
         
+        # Poll progress of the running tasks once per tick
+        active_tasks = self.worker.active_tasks() if self.worker else []
+        for task in active_tasks:
+            progress = task.progress
+            if progress != self._polled_progress.get(task.description):
+                self._polled_progress[task.description] = progress
+                self.on_progress_updated(task, progress)
+        
+        if not self._progress_dirty:
+            return
+        self._progress_dirty = False
+        
         # Calculate overall progress
         completed = self.completed_clips + self.failed_clips
-        if completed > 0:
-            # Completed tasks count as 100%, current task has progress
-            current_progress = 0
-            if self.worker and self.worker.current_task:
-                current_progress = self.worker.current_task.progress
+        if completed > 0 or active_tasks:
+            # Completed tasks count as 100%, running tasks have progress
+            current_progress = sum(task.progress for task in active_tasks)
             
-            overall = (completed - 1 + current_progress) / self.total_clips * 100
-            overall = min(100, max(0, overall))
+            overall = (completed + current_progress) / self.total_clips * 100
+            overall = int(min(100, max(0, overall)))
             
-            self.overall_progress.setValue(int(overall))
-            self.overall_label.setText(f"{int(overall)}%")
+            if overall != self._last_overall_pct:
+                self._last_overall_pct = overall
+                self.overall_progress.setValue(overall)
+                self.overall_label.setText(f"{overall}%")
         
         # Estimate remaining time
         if completed > 0 and self.completed_clips > 0:
-            elapsed = (datetime.now() - self.start_time).total_seconds()
+            elapsed = time.monotonic() - self.start_time
             avg_time_per_task = elapsed / self.completed_clips
             remaining_tasks = self.total_clips - completed
             remaining_seconds = remaining_tasks * avg_time_per_task
@@ -844,7 +1026,10 @@ class VideoCutterWindow(QMainWindow):
             secs = int(remaining_seconds % 60)
             
             remaining_str = f"{hours:02d}:{minutes:02d}:{secs:02d}"
-            self.time_label.setText(f"预计剩余时间: {remaining_str}")
+            # Skip the label repaint when the estimate hasn't changed
+            if remaining_str != self._last_remaining_str:
+                self._last_remaining_str = remaining_str
+                self.time_label.setText(f"预计剩余时间: {remaining_str}")
     
     def show_about(self):
         """Show about dialog."""
@@ -855,7 +1040,7 @@ class VideoCutterWindow(QMainWindow):
             "功能:\n"
             "- 从多个视频中按时间段截取片段\n"
             "- 支持多种视频格式 (mkv, mp4, mov等)\n"
-            "- 三种输出质量等级\n"
+            "- 多种输出质量等级, 支持不转码快速剪辑\n"
             "- 实时进度显示和剩余时间估算\n"
             "- 暂停/继续/停止功能"
         )
@@ -876,6 +1061,12 @@ class VideoCutterWindow(QMainWindow):
             self.worker.stop()
             self.worker.wait()
         
+        for thread in (self.scan_thread, self.excel_thread):
+            if thread and thread.isRunning():
+                thread.wait()
+        
+        self.logger.info("Application closing")
+        shutdown_logging()
         event.accept()
 
 
@@ -885,9 +1076,6 @@ def main():
     app.setStyle("Fusion")  # Use Fusion style for better look
     
     # Set application icon
-    from pathlib import Path
-    import platform
-    
     # Choose icon format based on platform
     system = platform.system()
     if system == "Darwin":
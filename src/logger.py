@@ -1,7 +1,10 @@
 """Logging system for video cutter application."""
 import os
 import sys
+import queue
+import atexit
 import logging
+import logging.handlers
 from datetime import datetime
 from pathlib import Path
 
@@ -18,13 +21,24 @@ def get_log_file_path() -> Path:
     return base_dir / "log.txt"
 
 
+# Background listener that writes queued records to the real handlers
+_listener: logging.handlers.QueueListener | None = None
+
+
 def setup_logging() -> logging.Logger:
-    """Setup logging to both file and console."""
+    """
+    Setup logging to both file and console.
+    
+    Records go through a queue and are written by a listener thread, so
+    logging from the worker threads never waits on disk I/O.
+    """
+    global _listener
     logger = logging.getLogger('video_cutter')
     logger.setLevel(logging.DEBUG)
     
     # Clear existing handlers
     logger.handlers.clear()
+    shutdown_logging()
     
     # File handler - always log everything
     log_file = get_log_file_path()
@@ -35,14 +49,20 @@ def setup_logging() -> logging.Logger:
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
     
     # Console handler for debugging
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_formatter = logging.Formatter('%(message)s')
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
     
     # Write session separator
     logger.info("=" * 60)
@@ -53,6 +73,16 @@ def setup_logging() -> logging.Logger:
     return logger
 
 
+def shutdown_logging():
+    """Flush queued log records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
 # Global logger instance
 _logger: logging.Logger | None = None
 
@@ -83,7 +113,9 @@ def log_exception(exc: Exception, context: str = ""):
     import traceback
     logger = get_logger()
     if context:
-        logger.error(f"{context}: {str(exc)}")
+        logger.error("%s: %s", context, exc)
     else:
-        logger.error(str(exc))
-    logger.debug(traceback.format_exc())
+        logger.error("%s", exc)
+    # Only build the traceback text if a DEBUG record would be kept
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s", traceback.format_exc())
@@ -1,9 +1,63 @@
 """Utility functions for video cutter."""
+import os
 import re
-from datetime import datetime
+import sys
+import bisect
+import functools
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Iterable
 
 
+# Filename timestamp patterns, compiled once and tried in order
+_FILENAME_PATTERNS = tuple(re.compile(p) for p in (
+    # yyyymmdd_hhmmss (compact format, may have prefix/suffix)
+    r'(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})',
+    # yyyymmdd_hhmm (compact format, no seconds)
+    r'(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})',
+    # yyyy-mm-dd hh-mm-ss or yyyy.mm.dd hh.mm.ss (OBS style, 2-digit required)
+    r'(\d{4})[-.](\d{2})[-.](\d{2})[\s_](\d{2})[-.](\d{2})[-.](\d{2})',
+    # yyyy-mm-dd hh-mm (no seconds)
+    r'(\d{4})[-.](\d{2})[-.](\d{2})[\s_](\d{2})[-.](\d{2})',
+    # yyyy/m/d h:m:s or yyyy/mm/dd hh:mm:ss (dashcam style, flexible digits)
+    # This can match both standalone filename and path with date directories
+    r'(\d{4})/(\d{1,2})/(\d{1,2})\s+(\d{1,2}):(\d{2}):(\d{2})',
+    # yyyy/m/d h:m (no seconds, dashcam style)
+    r'(\d{4})/(\d{1,2})/(\d{1,2})\s+(\d{1,2}):(\d{2})',
+))
+
+# The three "no seconds" patterns above as one alternation without groups.
+# Every pattern's matches contain a match of this one, so a single search
+# rejects names without a timestamp instead of six failed searches.
+_ANY_FILENAME_PATTERN = re.compile(
+    r'\d{4}(?:\d{4}_\d{4}'
+    r'|[-.]\d{2}[-.]\d{2}[\s_]\d{2}[-.]\d{2}'
+    r'|/\d{1,2}/\d{1,2}\s+\d{1,2}:\d{2})'
+)
+
+
+def _parse_compact_timestamp(text: str) -> datetime | None:
+    """
+    Fast path for the compact yyyymmdd_hhmmss format, without a regex.
+    
+    Finds the same leftmost match as the first filename pattern.
+    
+    Raises:
+        ValueError: If the match is not a valid date/time
+    """
+    underscore = text.find('_', 8)
+    while underscore != -1:
+        digits = text[underscore - 8:underscore] + text[underscore + 1:underscore + 7]
+        if len(digits) == 14 and digits.isdecimal():
+            # ISO basic format, parsed and validated in C without six int()
+            # calls (Python 3.11+; older versions raise and fall through)
+            return datetime.fromisoformat(digits[:8] + 'T' + digits[8:])
+        underscore = text.find('_', underscore + 1)
+    return None
+
+
+# Pure function of the name; the same files are parsed on every folder scan
+@functools.lru_cache(maxsize=4096)
 def parse_video_filename(filename: str) -> datetime | None:
     """
     Parse video filename to extract start time.
@@ -23,33 +77,33 @@ def parse_video_filename(filename: str) -> datetime | None:
     Returns:
         datetime object or None if parsing fails
     """
-    # Remove extension
-    stem = Path(filename).stem
-    
     # Also try full path string for dashcam style with directories
     full_str = str(filename)
     
-    # Try different patterns
-    patterns = [
-        # yyyymmdd_hhmmss (compact format, may have prefix/suffix)
-        r'(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})',
-        # yyyymmdd_hhmm (compact format, no seconds)
-        r'(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})',
-        # yyyy-mm-dd hh-mm-ss or yyyy.mm.dd hh.mm.ss (OBS style, 2-digit required)
-        r'(\d{4})[-.](\d{2})[-.](\d{2})[\s_](\d{2})[-.](\d{2})[-.](\d{2})',
-        # yyyy-mm-dd hh-mm (no seconds)
-        r'(\d{4})[-.](\d{2})[-.](\d{2})[\s_](\d{2})[-.](\d{2})',
-        # yyyy/m/d h:m:s or yyyy/mm/dd hh:mm:ss (dashcam style, flexible digits)
-        # This can match both standalone filename and path with date directories
-        r'(\d{4})/(\d{1,2})/(\d{1,2})\s+(\d{1,2}):(\d{2}):(\d{2})',
-        # yyyy/m/d h:m (no seconds, dashcam style)
-        r'(\d{4})/(\d{1,2})/(\d{1,2})\s+(\d{1,2}):(\d{2})',
-    ]
-    
-    # Try full path first (for dashcam style with directories), then stem
-    for search_str in [full_str, stem]:
-        for pattern in patterns:
-            match = re.search(pattern, search_str)
+    # Compact names (the most common camera format) skip the regex cascade.
+    # On an invalid date fall through, since later patterns may still match.
+    try:
+        start_time = _parse_compact_timestamp(full_str)
+        if start_time:
+            return start_time
+    except ValueError:
+        pass
+    
+    # Try full path first (for dashcam style with directories), then stem.
+    # A bare filename already contains its stem, so searching it again
+    # can't find anything new.
+    if '/' in full_str or '\\' in full_str:
+        # Remove extension
+        search_strs = (full_str, Path(filename).stem)
+    else:
+        search_strs = (full_str,)
+    
+    for search_str in search_strs:
+        if not _ANY_FILENAME_PATTERN.search(search_str):
+            continue
+        
+        for pattern in _FILENAME_PATTERNS:
+            match = pattern.search(search_str)
             if match:
                 groups = match.groups()
                 try:
@@ -69,6 +123,19 @@ def parse_video_filename(filename: str) -> datetime | None:
     return None
 
 
+def parse_video_filenames(filenames: Iterable[str]) -> list[datetime | None]:
+    """
+    Parse start times for many video filenames at once.
+    
+    Args:
+        filenames: Video filenames or paths
+    
+    Returns:
+        List of datetime (or None where parsing fails), in input order
+    """
+    return [parse_video_filename(name) for name in filenames]
+
+
 def format_duration(seconds: float) -> str:
     """Format seconds to HH:MM:SS string."""
     hours = int(seconds // 3600)
@@ -77,6 +144,10 @@ def format_duration(seconds: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
+# Extensions accepted by get_video_files()
+_VIDEO_EXTENSIONS = frozenset({'.mkv', '.mp4', '.mov', '.avi', '.wmv', '.flv', '.webm'})
+
+
 def get_video_files(folder_path: Path) -> list[Path]:
     """
     Get all video files from a folder.
@@ -87,13 +158,19 @@ def get_video_files(folder_path: Path) -> list[Path]:
     Returns:
         List of video file paths
     """
-    video_extensions = {'.mkv', '.mp4', '.mov', '.avi', '.wmv', '.flv', '.webm'}
     videos = []
     
     if folder_path.exists() and folder_path.is_dir():
-        for file in folder_path.iterdir():
-            if file.is_file() and file.suffix.lower() in video_extensions:
-                videos.append(file)
+        # DirEntry.is_file() reuses the file type from the directory listing
+        # instead of a stat() per file. The extension is checked on the name
+        # string first (same rule as Path.suffix), so a Path is only built
+        # for accepted files.
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                name = entry.name
+                dot = name.rfind('.')
+                if dot > 0 and name[dot:].lower() in _VIDEO_EXTENSIONS and entry.is_file():
+                    videos.append(Path(entry.path))
     
     return sorted(videos)
 
@@ -111,21 +188,42 @@ def find_video_for_time(videos: list[tuple[Path, datetime]], target_time: dateti
     """
     # Sort videos by start time
     sorted_videos = sorted(videos, key=lambda x: x[1])
+    starts = [start_time for _, start_time in sorted_videos]
     
-    # Find video that should contain target time
     # We need video duration info, but for now use heuristics
-    # Assume each video covers time until the next video starts
-    
-    for i, (video_path, start_time) in enumerate(sorted_videos):
-        # If there's a next video, this one covers until that starts
-        if i + 1 < len(sorted_videos):
-            end_time = sorted_videos[i + 1][1]
-        else:
-            # Last video - assume it's long enough (we'll verify with ffmpeg)
-            from datetime import timedelta
-            end_time = start_time + timedelta(hours=24)  # Generous default
-        
-        if start_time <= target_time < end_time:
-            return video_path
+    # Assume each video covers time until the next video starts, so the
+    # candidate is the last video starting at or before the target
+    i = bisect.bisect_right(starts, target_time) - 1
+    if i < 0:
+        return None
+    
+    video_path, start_time = sorted_videos[i]
+    if i + 1 < len(sorted_videos):
+        end_time = starts[i + 1]
+    else:
+        # Last video - assume it's long enough (we'll verify with ffmpeg)
+        end_time = start_time + timedelta(hours=24)  # Generous default
+    
+    if target_time < end_time:
+        return video_path
     
     return None
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the per-user cache directory for video cutter.
+    
+    - Windows: %LOCALAPPDATA%\\video-cutter
+    - macOS: ~/Library/Caches/video-cutter
+    - Linux: $XDG_CACHE_HOME/video-cutter (default ~/.cache/video-cutter)
+    
+    The directory is not created here.
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+    elif sys.platform == 'darwin':
+        base = Path.home() / 'Library' / 'Caches'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'video-cutter'
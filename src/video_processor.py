@@ -1,14 +1,43 @@
 """Video processing using ffmpeg."""
+import os
+import re
 import json
+import time
+import atexit
+import bisect
+import shutil
+import hashlib
+import signal
+import selectors
 import subprocess
+import tempfile
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
-from .utils import parse_video_filename
-from .ffmpeg_manager import get_ffmpeg_path, get_ffprobe_path, get_subprocess_args
+from .utils import parse_video_filename, get_cache_dir
+from .logger import get_logger
+from .container_probe import probe_container
+from .ffmpeg_manager import (
+    get_ffmpeg_path, get_ffprobe_path, get_subprocess_args,
+    get_hw_h264_encoder, HW_H264_ENCODERS
+)
+
+try:
+    # Optional faster JSON parser for ffprobe output
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    # Optional in-process probing via libavformat, skips the ffprobe spawn
+    import av
+except ImportError:
+    av = None
 
 
 @dataclass
@@ -42,6 +71,12 @@ class QualitySettings:
     """Video quality settings."""
     name: str
     bitrate_ratio: float  # ratio of original bitrate
+    copy_streams: bool = False  # remux without re-encoding
+    
+    @classmethod
+    def stream_copy(cls) -> 'QualitySettings':
+        # Cuts start on the keyframe before the clip start
+        return cls("原始", 1.0, copy_streams=True)
     
     @classmethod
     def high(cls) -> 'QualitySettings':
@@ -68,62 +103,372 @@ class OffsetSettings:
         return cls(start_offset=0.0, end_offset=0.0, min_duration=10.0)
 
 
-def get_video_info(video_path: Path) -> VideoInfo | None:
+# Probed stream properties: (duration, width, height, bitrate, fps)
+_ProbeResult = tuple[float, int, int, int, float]
+
+
+def _probe_with_av(video_path: Path) -> _ProbeResult | None:
+    """
+    Read video properties in-process with PyAV, without spawning ffprobe.
+    
+    Returns:
+        Probe result, or None if PyAV can't read the file
+    """
+    try:
+        with av.open(str(video_path)) as container:
+            if not container.streams.video:
+                return None
+            video_stream = container.streams.video[0]
+            
+            # Same fields ffprobe reports as format duration/bit_rate and r_frame_rate
+            duration = container.duration / av.time_base if container.duration else 0.0
+            fps = float(video_stream.base_rate) if video_stream.base_rate else 30.0
+            return (
+                duration,
+                video_stream.width or 0,
+                video_stream.height or 0,
+                container.bit_rate or 0,
+                fps
+            )
+    except Exception:
+        return None
+
+
+def _parse_frame_rate(fps_str: str) -> float:
+    """
+    Parse an ffprobe frame rate such as "30000/1001" or "25".
+    
+    Returns 30.0 for a zero denominator or an unparseable value.
+    """
+    num, sep, den = fps_str.partition('/')
+    try:
+        if not sep:
+            return float(num)
+        den_value = int(den)
+        return int(num) / den_value if den_value > 0 else 30.0
+    except ValueError:
+        return 30.0
+
+
+def _starts_on_keyframe(video_path: Path, seek_time: float, tolerance: float = 0.05) -> bool:
+    """
+    Check whether a video keyframe lies at most tolerance before seek_time.
+    
+    A stream copy with input seeking starts at the last keyframe at or
+    before seek_time, so a keyframe just after it doesn't count.
+    Only the packets around seek_time are read (ffprobe -read_intervals),
+    not the whole file. Timestamps are compared as absolute stream times,
+    so files with a non-zero start time are reported as not aligned.
+    
+    Returns:
+        True if a stream copy starting at seek_time would begin on a keyframe
+    """
+    cmd = [
+        get_ffprobe_path(),
+        '-v', 'quiet',
+        '-select_streams', 'v:0',
+        '-read_intervals', f'{max(0.0, seek_time - tolerance)}%{seek_time + tolerance}',
+        '-show_entries', 'packet=pts_time,flags',
+        '-of', 'csv=p=0',
+        str(video_path)
+    ]
+    try:
+        result = subprocess.run(cmd, **get_subprocess_args(timeout=10))
+    except (OSError, subprocess.SubprocessError):
+        return False
+    if result.returncode != 0:
+        return False
+    
+    # Lines look like "12.000000,K__"
+    for line in result.stdout.splitlines():
+        pts_time, _, flags = line.partition(',')
+        if 'K' not in flags:
+            continue
+        try:
+            if seek_time - tolerance <= float(pts_time) <= seek_time:
+                return True
+        except ValueError:
+            continue
+    return False
+
+
+def _probe_with_ffprobe(video_path: Path) -> _ProbeResult | None:
+    """
+    Read video properties with an ffprobe subprocess.
+    
+    Returns:
+        Probe result, or None if ffprobe failed or found no video stream
+    """
+    ffprobe_path = get_ffprobe_path()
+    cmd = [
+        ffprobe_path,
+        '-v', 'quiet',
+        '-threads', '1',  # One core per probe, get_video_infos() runs several
+        '-print_format', 'json',
+        # Only the fields read below, for the first video stream
+        '-select_streams', 'v:0',
+        '-show_entries', 'format=duration,bit_rate:stream=codec_type,width,height,r_frame_rate',
+        str(video_path)
+    ]
+    
+    # Keep stdout as bytes; both parsers accept them directly
+    result = subprocess.run(cmd, **get_subprocess_args(timeout=30, text=False))
+    
+    if result.returncode != 0:
+        return None
+    
+    data = json_loads(result.stdout)
+    
+    # -select_streams v:0 leaves at most the first video stream
+    streams = data.get('streams')
+    if not streams:
+        return None
+    video_stream = streams[0]
+    
+    fmt = data.get('format') or {}
+    duration = float(fmt.get('duration', 0))
+    width = int(video_stream.get('width', 0))
+    height = int(video_stream.get('height', 0))
+    bitrate = int(fmt.get('bit_rate', 0))
+    
+    fps = _parse_frame_rate(video_stream.get('r_frame_rate', '30/1'))
+    
+    return duration, width, height, bitrate, fps
+
+
+# Probe results reused across launches while a file's mtime and size are
+# unchanged. Loaded on first use, written back by get_video_infos().
+_PROBE_CACHE_FILE = get_cache_dir() / "probe_cache.json"
+_PROBE_CACHE_MAX_ENTRIES = 5000
+_probe_cache: dict | None = None
+_probe_cache_dirty = False
+_probe_cache_lock = threading.Lock()
+
+
+def _get_probe_cache() -> dict:
+    """Get the in-memory probe cache, loading it from disk on first use."""
+    global _probe_cache
+    if _probe_cache is None:
+        try:
+            cache = json_loads(_PROBE_CACHE_FILE.read_bytes())
+        except (OSError, ValueError):
+            cache = {}
+        _probe_cache = cache if isinstance(cache, dict) else {}
+    return _probe_cache
+
+
+def _get_cached_probe(key: str, stat: os.stat_result) -> _ProbeResult | None:
+    """Get the cached probe result for a file if it has not changed."""
+    with _probe_cache_lock:
+        cache = _get_probe_cache()
+        entry = cache.pop(key, None)
+        if entry is not None:
+            cache[key] = entry  # Move to the end, so eviction drops the least recently used
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("mtime") != stat.st_mtime or entry.get("size") != stat.st_size:
+        return None
+    probe = entry.get("probe")
+    if not isinstance(probe, list) or len(probe) != 5:
+        return None
+    return tuple(probe)
+
+
+def _store_cached_probe(key: str, stat: os.stat_result, probe: _ProbeResult):
+    """Remember a probe result in memory until save_probe_cache()."""
+    global _probe_cache_dirty
+    with _probe_cache_lock:
+        cache = _get_probe_cache()
+        cache.pop(key, None)  # Re-insert at the end (most recently used)
+        cache[key] = {"mtime": stat.st_mtime, "size": stat.st_size, "probe": list(probe)}
+        while len(cache) > _PROBE_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+        _probe_cache_dirty = True
+
+
+def save_probe_cache():
+    """Write new probe results to disk (best effort)."""
+    global _probe_cache_dirty
+    with _probe_cache_lock:
+        if not _probe_cache_dirty:
+            return
+        try:
+            _PROBE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = _PROBE_CACHE_FILE.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(_probe_cache, ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp_file, _PROBE_CACHE_FILE)
+            _probe_cache_dirty = False
+        except OSError:
+            pass
+
+
+# get_video_infos() saves after each scan; this covers direct get_video_info() use
+atexit.register(save_probe_cache)
+
+
+# Finished clips, copied under a key of source, range and quality so a
+# re-run can link them back instead of encoding again. Entry names carry
+# the size and mtime they were stored with: an output restored as a hard
+# link shares the entry's file, and editing it in place invalidates the
+# entry instead of changing what later runs get. Least recently used
+# entries are evicted beyond _CLIP_CACHE_MAX_BYTES.
+_CLIP_CACHE_DIR = get_cache_dir() / "clips"
+_CLIP_CACHE_MAX_BYTES = 2 << 30
+_clip_cache_bytes: int | None = None  # Total size, known after a prune
+_clip_cache_lock = threading.Lock()
+
+
+def _clip_cache_key(
+    video: VideoInfo,
+    seek_time: float,
+    duration: float,
+    quality: QualitySettings
+) -> str | None:
+    """Get the cache key for a clip, or None if the source can't be stat'ed."""
+    try:
+        stat = os.stat(video.path)
+    except OSError:
+        return None
+    key = (
+        f"{os.path.abspath(video.path)}|{stat.st_mtime_ns}|{stat.st_size}|"
+        f"{round(seek_time * 1000)}|{round(duration * 1000)}|"
+        f"{quality.name}|{quality.bitrate_ratio}|{quality.copy_streams}"
+    )
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def _parse_clip_cache_name(name: str) -> tuple[str, int, int] | None:
+    """Split an entry name "<key>-<size>-<mtime_ns>.mp4" into its parts."""
+    stem, dot, ext = name.partition('.')
+    parts = stem.split('-')
+    if ext != 'mp4' or len(parts) != 3:
+        return None
+    key, size, mtime_ns = parts
+    if not (size.isdigit() and mtime_ns.isdigit()):
+        return None
+    return key, int(size), int(mtime_ns)
+
+
+def _restore_cached_clip(key: str, output_path: Path) -> bool:
+    """Link (or copy, across filesystems) a cached clip to output_path."""
+    for cached in _CLIP_CACHE_DIR.glob(f"{key}-*.mp4"):
+        parsed = _parse_clip_cache_name(cached.name)
+        try:
+            stat = cached.stat()
+            if parsed is None or (stat.st_size, stat.st_mtime_ns) != parsed[1:]:
+                # Changed since it was stored, e.g. the output edited in place
+                cached.unlink()
+                continue
+            output_path.unlink(missing_ok=True)
+            try:
+                os.link(cached, output_path)
+            except OSError:
+                shutil.copyfile(cached, output_path)
+            # atime marks the last use for eviction; mtime stays as stored
+            os.utime(cached, ns=(time.time_ns(), stat.st_mtime_ns))
+            return True
+        except OSError:
+            continue
+    return False
+
+
+def _store_cached_clip(output_path: Path, key: str):
+    """Copy a finished clip into the cache (best effort)."""
+    global _clip_cache_bytes
+    tmp_file = _CLIP_CACHE_DIR / f"{key}.tmp"
+    try:
+        size = output_path.stat().st_size
+        if not 0 < size <= _CLIP_CACHE_MAX_BYTES // 4:
+            return
+        _CLIP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A copy, not a link, so later edits to the output don't reach it
+        shutil.copyfile(output_path, tmp_file)
+        stat = tmp_file.stat()
+        os.replace(tmp_file, _CLIP_CACHE_DIR / f"{key}-{stat.st_size}-{stat.st_mtime_ns}.mp4")
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        return
+    with _clip_cache_lock:
+        over_limit = _clip_cache_bytes is None or _clip_cache_bytes + size > _CLIP_CACHE_MAX_BYTES
+        if _clip_cache_bytes is not None:
+            _clip_cache_bytes += size
+    if over_limit:
+        prune_clip_cache()
+
+
+def prune_clip_cache():
+    """Delete changed cache entries and evict the least recently used beyond the size limit."""
+    global _clip_cache_bytes
+    with _clip_cache_lock:
+        try:
+            entries = list(os.scandir(_CLIP_CACHE_DIR))
+        except OSError:
+            _clip_cache_bytes = 0
+            return
+        kept = []
+        for entry in entries:
+            try:
+                stat = entry.stat()
+                parsed = _parse_clip_cache_name(entry.name)
+                if entry.name.endswith('.tmp'):
+                    # Left over from a crash; a recent one may still be written
+                    if stat.st_mtime < time.time() - 3600:
+                        os.unlink(entry.path)
+                elif parsed is None or (stat.st_size, stat.st_mtime_ns) != parsed[1:]:
+                    os.unlink(entry.path)  # Changed since it was stored
+                else:
+                    kept.append((stat.st_atime, stat.st_size, entry.path))
+            except OSError:
+                pass
+        kept.sort()
+        total = sum(size for _, size, _ in kept)
+        for _, size, path in kept:
+            if total <= _CLIP_CACHE_MAX_BYTES:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+        _clip_cache_bytes = total
+
+
+def get_video_info(video_path: Path, start_time: datetime | None = None) -> VideoInfo | None:
     """
-    Get video information using ffprobe.
+    Get video information from the MP4/MKV headers when possible,
+    otherwise with PyAV if installed, otherwise with ffprobe.
+    
+    Results are cached on disk per file; unchanged files are not probed
+    again. Call save_probe_cache() to persist new results.
     
     Args:
         video_path: Path to video file
+        start_time: Start time already parsed from the filename, if known
     
     Returns:
         VideoInfo object or None if failed
     """
     try:
-        ffprobe_path = get_ffprobe_path()
-        cmd = [
-            ffprobe_path,
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_streams',
-            str(video_path)
-        ]
-        
-        result = subprocess.run(cmd, **get_subprocess_args(timeout=30))
-        
-        if result.returncode != 0:
-            return None
-        
-        data = json.loads(result.stdout)
-        
-        # Find video stream
-        video_stream = None
-        for stream in data.get('streams', []):
-            if stream.get('codec_type') == 'video':
-                video_stream = stream
-                break
-        
-        if not video_stream:
-            return None
-        
         # Parse start time from filename
-        start_time = parse_video_filename(video_path.name)
+        if start_time is None:
+            start_time = parse_video_filename(video_path.name)
         if not start_time:
             return None
         
-        duration = float(data.get('format', {}).get('duration', 0))
-        width = int(video_stream.get('width', 0))
-        height = int(video_stream.get('height', 0))
-        bitrate = int(data.get('format', {}).get('bit_rate', 0))
-        
-        # Parse fps
-        fps_str = video_stream.get('r_frame_rate', '30/1')
-        if '/' in fps_str:
-            num, den = fps_str.split('/')
-            fps = float(num) / float(den) if float(den) > 0 else 30.0
-        else:
-            fps = float(fps_str)
+        cache_key = os.path.abspath(video_path)
+        stat = os.stat(video_path)
+        probe = _get_cached_probe(cache_key, stat)
+        if probe is None:
+            probe = probe_container(video_path)
+            if probe is None and av is not None:
+                probe = _probe_with_av(video_path)
+            if probe is None:
+                probe = _probe_with_ffprobe(video_path)
+            if probe is None:
+                return None
+            _store_cached_probe(cache_key, stat, probe)
         
+        duration, width, height, bitrate, fps = probe
         return VideoInfo(
             path=video_path,
             start_time=start_time,
@@ -134,11 +479,139 @@ def get_video_info(video_path: Path) -> VideoInfo | None:
             fps=fps
         )
         
-    except Exception as e:
-        print(f"Error getting video info: {e}")
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
+        # Unreadable file, ffprobe spawn/timeout failure or malformed output
+        get_logger().warning("Error getting video info for %s: %s", video_path, e)
         return None
 
 
+def get_video_infos(
+    video_paths: list[Path],
+    start_times: list[datetime | None] | None = None,
+    max_workers: int | None = None
+) -> Iterator[VideoInfo | None]:
+    """
+    Get video information for many files, running ffprobe in parallel.
+    
+    Each probe mostly waits on its ffprobe subprocess, so threads overlap
+    the process startup and I/O.
+    New probe results are saved to the disk cache once all paths are done.
+    
+    Args:
+        video_paths: Paths to video files
+        start_times: Start times already parsed from the filenames, if known
+        max_workers: Number of concurrent probes (default: CPU count, at most 8)
+    
+    Yields:
+        VideoInfo or None for each path, in input order
+    """
+    if start_times is None:
+        start_times = [None] * len(video_paths)
+    
+    # Capped: past a few probes the extra processes only add OS overhead
+    max_workers = max_workers or min(os.cpu_count() or 4, 8)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(get_video_info, video_paths, start_times)
+    finally:
+        save_probe_cache()
+
+
+# Popen arguments shared by every ffmpeg run. Binary stdout pipe: progress
+# lines are matched as bytes.
+_FFMPEG_POPEN_ARGS = {'stdout': subprocess.PIPE}
+if platform.system() == 'Windows':
+    _FFMPEG_POPEN_ARGS['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+# Complete "-progress pipe:1" position lines; despite the name the value is
+# in microseconds
+_OUT_TIME_RE = re.compile(rb'out_time_ms=(\d+)\r?\n')
+
+# ffmpeg errors from a GPU device or driver that can't start, as opposed to
+# errors caused by the clip or its source. Errors logged by the encoder
+# itself ("[h264_nvenc @ ...]") count too, see _is_hw_encoder_error().
+_HW_INIT_ERROR_RE = re.compile(
+    r'Cannot load|No capable devices|No NVENC capable|OpenEncodeSessionEx failed'
+    r'|hwaccel initiali[sz]ation|MFX session|AMF failed|DLL \S+ failed'
+    r'|cannot create compression session|Device creation failed',
+    re.IGNORECASE
+)
+
+
+def _is_hw_encoder_error(error: str, encoder: str) -> bool:
+    """Check whether an ffmpeg error means the hardware encoder itself can't be used."""
+    return f'[{encoder} @' in error or _HW_INIT_ERROR_RE.search(error) is not None
+
+
+def _open_exit_selector(process: subprocess.Popen) -> tuple[selectors.BaseSelector, int] | None:
+    """
+    Get a selector that becomes ready when the process exits (Linux pidfd).
+    
+    Popen.wait(timeout) polls with short sleeps on POSIX; selecting on a
+    pidfd blocks in the kernel until the exit instead.
+    
+    Returns:
+        (selector, pidfd) to close after use, or None where pidfds are
+        unavailable (callers then use Popen.wait(timeout))
+    """
+    if not hasattr(os, 'pidfd_open'):
+        return None
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except OSError:
+        return None
+    selector = selectors.DefaultSelector()
+    selector.register(pidfd, selectors.EVENT_READ)
+    return selector, pidfd
+
+
+def _suspend_process(process: subprocess.Popen):
+    """
+    Freeze a running process (SIGSTOP). Windows has no equivalent signal,
+    so there ffmpeg keeps running and only the monitoring pauses.
+    """
+    if hasattr(signal, 'SIGSTOP') and process.poll() is None:
+        process.send_signal(signal.SIGSTOP)
+
+
+def _resume_process(process: subprocess.Popen):
+    """Continue a process frozen by _suspend_process() (SIGCONT)."""
+    if hasattr(signal, 'SIGCONT') and process.poll() is None:
+        process.send_signal(signal.SIGCONT)
+
+
+def _video_end(videos: list[VideoInfo], i: int) -> datetime:
+    """End time of videos[i], from a list sorted by start time."""
+    video = videos[i]
+    
+    # Handle videos with unknown duration (duration=0)
+    if video.duration <= 0:
+        # Use next video's start time as end time, or assume 24 hours
+        if i + 1 < len(videos):
+            return videos[i + 1].start_time
+        # Last video: assume it covers until end of day + 1
+        return video.start_time + timedelta(hours=25)
+    return video.start_time + timedelta(seconds=video.duration)
+
+
+def sort_videos(
+    videos: list[VideoInfo]
+) -> tuple[list[VideoInfo], list[datetime], list[datetime]]:
+    """
+    Sort videos by start time for repeated find_video_for_clip() lookups.
+    
+    Returns:
+        Tuple of (sorted videos, their start times, latest end time of
+        each video and all videos before it)
+    """
+    sorted_videos = sorted(videos, key=lambda v: v.start_time)
+    max_ends = []
+    for i in range(len(sorted_videos)):
+        end = _video_end(sorted_videos, i)
+        max_ends.append(max(end, max_ends[-1]) if max_ends else end)
+    return sorted_videos, [v.start_time for v in sorted_videos], max_ends
+
+
 class VideoProcessor:
     """Handles video cutting operations."""
     
@@ -146,11 +619,34 @@ class VideoProcessor:
     STALL_TIMEOUT = 10  # 进程卡住超时时间（秒）
     MAX_RETRIES = 3     # 最大重试次数
     
+    # Clips encoded at the same time. Each libx264 encode already runs
+    # several threads, so only wide machines get more than one.
+    PARALLEL_CLIPS = max(1, min(4, (os.cpu_count() or 1) // 4))
+    # Encoder threads per ffmpeg, so parallel clips split the cores instead
+    # of each starting one thread per core (0 = ffmpeg's default)
+    ENCODER_THREADS = (os.cpu_count() or 1) // PARALLEL_CLIPS if PARALLEL_CLIPS > 1 else 0
+    
     def __init__(self):
-        self._process: subprocess.Popen | None = None
-        self._paused: bool = False
+        # Running ffmpeg processes, one per clip being cut
+        self._processes: set[subprocess.Popen] = set()
+        self._processes_lock = threading.Lock()
+        # Set once a hardware encoder fails, later clips use libx264
+        self._hw_encoder_failed = False
+        # Sources a stream copy failed for, re-encoded without a keyframe check
+        self._copy_failed_sources: set[Path] = set()
+        # Output paths of running clips, and those two clips have shared
+        self._output_users: dict[Path, int] = {}
+        self._shared_outputs: set[Path] = set()
+        # Progress readers, one per running ffmpeg; reused across clips
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=self.PARALLEL_CLIPS, thread_name_prefix='ffmpeg-io'
+        )
+        # Set while running, cleared while paused
+        self._resume_event = threading.Event()
+        self._resume_event.set()
         self._stopped: bool = False
         self.current_task: ClipTask | None = None
+        prune_clip_cache()
     
     def apply_time_offset(
         self,
@@ -185,7 +681,9 @@ class VideoProcessor:
         self,
         videos: list[VideoInfo],
         clip_start: datetime,
-        clip_end: datetime
+        clip_end: datetime,
+        video_starts: list[datetime] | None = None,
+        max_ends: list[datetime] | None = None
     ) -> VideoInfo | None:
         """
         Find the source video that contains the clip time range.
@@ -194,30 +692,27 @@ class VideoProcessor:
             videos: List of available video info
             clip_start: Clip start time
             clip_end: Clip end time
+            video_starts: Start times of videos. When given with max_ends,
+                videos must already be sorted by start time (see
+                sort_videos()), so repeated lookups skip the sort.
+            max_ends: Running latest end times from sort_videos()
         
         Returns:
             VideoInfo or None if no video covers the time range
         """
-        clip_duration = (clip_end - clip_start).total_seconds()
-        
-        # Sort videos by start time for better matching
-        sorted_videos = sorted(videos, key=lambda v: v.start_time)
+        if video_starts is None or max_ends is None:
+            # Sort videos by start time for better matching
+            videos, video_starts, max_ends = sort_videos(videos)
         
-        for i, video in enumerate(sorted_videos):
-            # Handle videos with unknown duration (duration=0)
-            if video.duration <= 0:
-                # Use next video's start time as end time, or assume 24 hours
-                if i + 1 < len(sorted_videos):
-                    video_end = sorted_videos[i + 1].start_time
-                else:
-                    # Last video: assume it covers until end of day + 1
-                    video_end = video.start_time + timedelta(hours=25)
-            else:
-                video_end = video.start_time + timedelta(seconds=video.duration)
+        # Start from the last video that starts at or before the clip; earlier
+        # videos only need checking when recordings overlap
+        for i in range(bisect.bisect_right(video_starts, clip_start) - 1, -1, -1):
+            if max_ends[i] < clip_end:
+                break  # Neither this video nor any earlier one reaches clip_end
             
             # Check if video covers the clip time range
-            if video.start_time <= clip_start and clip_end <= video_end:
-                return video
+            if clip_end <= _video_end(videos, i):
+                return videos[i]
         
         return None
     
@@ -226,204 +721,231 @@ class VideoProcessor:
         delta = clip_start - video.start_time
         return delta.total_seconds()
     
-    def _run_ffmpeg_once(
+    def _build_cmd(
         self,
         task: ClipTask,
         quality: QualitySettings,
-        progress_callback: Callable[[float], None] | None = None,
-        log_callback: Callable[[str], None] | None = None
-    ) -> tuple[bool, str]:
+        seek_time: float,
+        duration: float,
+        encoder: str = 'libx264'
+    ) -> list[str]:
         """
-        执行一次FFmpeg剪辑任务。
+        Build the ffmpeg command for a clip.
+        
+        Args:
+            task: Clip task
+            quality: Quality settings
+            seek_time: Seek position in the source video (seconds)
+            duration: Clip duration (seconds)
+            encoder: H.264 encoder to use when re-encoding
         
         Returns:
-            (success, error_message)
-            success=True 表示成功
-            success=False 且 error_message="STALLED" 表示卡住需要重试
+            ffmpeg argument list
         """
-        from .logger import get_logger
-        logger = get_logger()
-        
         video = task.video_info
         
-        # Calculate seek time and duration
-        seek_time = self.calculate_seek_time(video, task.clip_start)
-        duration = (task.clip_end - task.clip_start).total_seconds()
-        
         # Calculate output bitrate
         output_bitrate = int(video.bitrate * quality.bitrate_ratio)
         
-        # Ensure output directory exists
-        task.output_path.parent.mkdir(parents=True, exist_ok=True)
-        
         # Build ffmpeg command - 不使用 -movflags +faststart
         ffmpeg_path = get_ffmpeg_path()
         cmd = [
             ffmpeg_path,
             '-y',  # Overwrite output
+            '-hide_banner', '-nostats',  # stderr only carries errors
+            '-loglevel', 'error',
+        ]
+        if encoder in HW_H264_ENCODERS and not quality.copy_streams:
+            cmd += ['-hwaccel', 'auto']  # Decode on the GPU too, falls back to software
+        cmd += [
             '-ss', str(seek_time),  # Seek to start
             '-i', str(video.path),  # Input file
             '-t', str(duration),  # Duration
-            '-c:v', 'libx264',  # Video codec
-            '-preset', 'medium',  # Encoding speed
-            '-b:v', str(output_bitrate),  # Video bitrate
-            '-c:a', 'aac',  # Audio codec
-            '-b:a', '128k',  # Audio bitrate
+        ]
+        if quality.copy_streams:
+            cmd += [
+                '-c', 'copy',  # Remux only, no encoding
+                '-avoid_negative_ts', 'make_zero',  # Shift timestamps to start at 0
+            ]
+        else:
+            cmd += [
+                '-c:v', encoder,  # Video codec
+                '-threads', str(self.ENCODER_THREADS),  # Encoder threads
+                # Encoding speed
+                *HW_H264_ENCODERS.get(encoder, ['-preset', 'medium']),
+                '-b:v', str(output_bitrate),  # Video bitrate
+                '-c:a', 'aac',  # Audio codec
+                '-b:a', '128k',  # Audio bitrate
+            ]
+        cmd += [
             '-progress', 'pipe:1',  # Progress output
             str(task.output_path)
         ]
         
-        logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+        return cmd
+    
+    def _run_ffmpeg_once(
+        self,
+        task: ClipTask,
+        cmd: list[str],
+        duration: float,
+        progress_callback: Callable[[float], None] | None = None
+    ) -> tuple[bool, str]:
+        """
+        执行一次FFmpeg剪辑任务。
+        
+        Args:
+            task: ClipTask being cut; its status is set to "processing"
+            cmd: ffmpeg command from _build_cmd()
+            duration: Clip duration (seconds), for progress
+            progress_callback: Callback for progress updates (0.0 - 1.0)
+        
+        Returns:
+            (success, error_message)
+            success=True 表示成功
+            success=False 且 error_message="STALLED" 表示卡住需要重试
+        """
+        logger = get_logger()
+        
+        logger.debug("FFmpeg command: %s", ' '.join(cmd))
         
-        # Prepare subprocess arguments
-        # 使用 errors='replace' 避免编码错误
-        popen_kwargs = {
-            'stdout': subprocess.PIPE,
-            'stderr': subprocess.PIPE,
-            'text': True,
-            'errors': 'replace',  # 替换无法解码的字符
-            'encoding': 'utf-8'
-        }
-        if platform.system() == 'Windows':
-            popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+        # stderr goes to a temp file, so it needs no reader thread and a flood
+        # of decode errors can't fill a pipe and block ffmpeg; it is read only
+        # on failure.
+        stderr_file = tempfile.TemporaryFile()
         
+        process = None
+        exit_selector = None
         try:
-            self._process = subprocess.Popen(cmd, **popen_kwargs)
-            logger.info(f"FFmpeg process started (PID: {self._process.pid})")
+            process = subprocess.Popen(cmd, stderr=stderr_file, **_FFMPEG_POPEN_ARGS)
+            with self._processes_lock:
+                self._processes.add(process)
+                if not self._resume_event.is_set():
+                    _suspend_process(process)  # Retry started while paused
+            logger.info("FFmpeg process started (PID: %d)", process.pid)
             
             task.status = "processing"
             
-            import threading
-            import time
-            
-            last_progress = [0.0]
-            last_progress_log = [0]
-            line_count = [0]
-            process_finished = threading.Event()
-            last_activity_time = [time.time()]  # 记录最后一次活动时间
-            stalled = [False]  # 是否卡住
+            last_progress_log = 0
+            last_reported = 0.0
+            chunk_count = 0
+            last_activity_time = time.time()  # 记录最后一次活动时间
             
             def read_progress():
-                """Read progress from stdout."""
+                """Read progress from stdout in chunks, parsing only out_time_ms."""
+                nonlocal last_progress_log, last_reported, chunk_count, last_activity_time
                 try:
-                    while True:
-                        if process_finished.is_set():
-                            for line in self._process.stdout:
-                                line_count[0] += 1
-                            break
+                    # read1 returns whatever is buffered (up to 64 KiB) as soon
+                    # as anything arrives, and b'' once ffmpeg closes stdout
+                    read_chunk = process.stdout.read1
+                    while chunk := read_chunk(65536):
+                        chunk_count += 1
+                        last_activity_time = time.time()  # 更新活动时间
                         
-                        line = self._process.stdout.readline()
-                        if not line:
-                            if process_finished.is_set():
-                                break
-                            time.sleep(0.01)
-                            continue
-                        
-                        line_count[0] += 1
-                        last_activity_time[0] = time.time()  # 更新活动时间
+                        if chunk_count == 1:
+                            logger.debug("FFmpeg first output: %s",
+                                         chunk[:300].decode('utf-8', errors='replace'))
                         
-                        if line_count[0] <= 10:
-                            logger.debug(f"FFmpeg output line {line_count[0]}: {line.strip()}")
+                        # Only the newest complete progress line in the chunk matters
+                        matches = _OUT_TIME_RE.findall(chunk)
+                        if not matches:
+                            continue
+                        try:
+                            out_time_us = int(matches[-1])
+                            progress = min(1.0, out_time_us / 1000000 / duration)
+                        except ZeroDivisionError:
+                            continue
+                        # Skip changes below 0.5%; on long clips ffmpeg reports
+                        # twice a second with almost no movement
+                        if progress - last_reported < 0.005 and progress < 1.0:
+                            continue
+                        last_reported = progress
+                        task.progress = progress
+                        if progress_callback:
+                            progress_callback(progress)
                         
-                        if line.startswith('out_time_ms'):
-                            try:
-                                out_time_us = int(line.split('=')[1])
-                                progress = min(1.0, out_time_us / 1000000 / duration)
-                                last_progress[0] = progress
-                                task.progress = progress
-                                if progress_callback:
-                                    progress_callback(progress)
-                                
-                                progress_pct = int(progress * 100)
-                                if progress_pct >= last_progress_log[0] + 10:
-                                    logger.debug(f"Progress: {progress_pct}%")
-                                    last_progress_log[0] = progress_pct
-                            except (ValueError, ZeroDivisionError):
-                                pass
+                        progress_pct = int(progress * 100)
+                        # Log each 10% step once
+                        if progress_pct // 10 > last_progress_log // 10:
+                            logger.debug("Progress: %d%%", progress_pct)
+                            last_progress_log = progress_pct
                 except Exception as e:
-                    logger.debug(f"read_progress error: {e}")
+                    logger.debug("read_progress error: %s", e)
                 finally:
-                    logger.debug(f"Progress thread done, total lines: {line_count[0]}")
+                    logger.debug("Progress thread done, total chunks: %d", chunk_count)
             
-            progress_thread = threading.Thread(target=read_progress, daemon=True)
-            progress_thread.start()
+            progress_future = self._io_pool.submit(read_progress)
             
-            # 读取stderr（但不阻塞）
-            stderr_output = []
-            def read_stderr():
-                try:
-                    while True:
-                        if process_finished.is_set():
-                            for line in self._process.stderr:
-                                stderr_output.append(line)
-                            break
-                        line = self._process.stderr.readline()
-                        if not line:
-                            if process_finished.is_set():
-                                break
-                            time.sleep(0.01)
-                            continue
-                        stderr_output.append(line)
-                        last_activity_time[0] = time.time()
-                except Exception as e:
-                    logger.debug(f"read_stderr error: {e}")
-            
-            stderr_thread = threading.Thread(target=read_stderr, daemon=True)
-            stderr_thread.start()
-            
-            logger.debug(f"Waiting for FFmpeg (stall timeout: {self.STALL_TIMEOUT}s)...")
+            logger.debug("Waiting for FFmpeg (stall timeout: %ds)...", self.STALL_TIMEOUT)
+            exit_selector = _open_exit_selector(process)
             
             while True:
                 if self._stopped:
                     logger.warning("Task stopped by user")
-                    process_finished.set()
-                    self._process.kill()
+                    process.kill()
                     return (False, "STOPPED")
                 
-                while self._paused:
-                    time.sleep(0.1)
+                if not self._resume_event.is_set():
+                    # Block while paused; stop() also wakes us. ffmpeg is
+                    # suspended meanwhile, so don't count the pause as a stall.
+                    self._resume_event.wait()
+                    last_activity_time = time.time()
+                    continue
                 
                 # 检查是否卡住
-                time_since_activity = time.time() - last_activity_time[0]
+                time_since_activity = time.time() - last_activity_time
                 if time_since_activity > self.STALL_TIMEOUT:
-                    logger.warning(f"Process stalled for {time_since_activity:.0f}s, killing...")
-                    process_finished.set()
-                    self._process.kill()
-                    stalled[0] = True
+                    logger.warning("Process stalled for %.0fs, killing...", time_since_activity)
+                    process.kill()
                     return (False, "STALLED")
                 
-                # 等待进程
-                try:
-                    return_code = self._process.wait(timeout=0.5)
-                    process_finished.set()
-                    logger.info(f"FFmpeg finished with return code: {return_code}")
-                    break
-                except subprocess.TimeoutExpired:
-                    continue
+                # 等待进程: sleep until it exits or could next count as
+                # stalled. stop() kills the process, which ends the wait too.
+                timeout = max(0.1, self.STALL_TIMEOUT - time_since_activity)
+                if exit_selector is not None:
+                    if not exit_selector[0].select(timeout):
+                        continue
+                    return_code = process.wait()
+                else:
+                    try:
+                        return_code = process.wait(timeout=timeout)
+                    except subprocess.TimeoutExpired:
+                        continue
+                if self._stopped:
+                    continue  # Killed by stop(), reported as stopped above
+                logger.info("FFmpeg finished with return code: %s", return_code)
+                break
             
             # 等待线程
-            progress_thread.join(timeout=2.0)
-            stderr_thread.join(timeout=1.0)
+            wait([progress_future], timeout=2.0)
             
             if return_code == 0:
                 task.status = "completed"
                 task.progress = 1.0
                 if progress_callback:
                     progress_callback(1.0)
-                logger.info(f"Successfully created: {task.output_path.name}")
+                logger.info("Successfully created: %s", task.output_path.name)
                 return (True, "")
             else:
-                stderr = ''.join(stderr_output) if stderr_output else ""
+                # 使用 errors='replace' 避免编码错误
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode('utf-8', errors='replace').strip()
                 error_msg = stderr[:500] if stderr else f"FFmpeg exit code: {return_code}"
-                logger.error(f"FFmpeg failed: {error_msg}")
+                logger.error("FFmpeg failed: %s", error_msg)
                 return (False, error_msg)
                 
         except Exception as e:
-            logger.exception(f"Exception during FFmpeg: {str(e)}")
+            logger.exception("Exception during FFmpeg: %s", e)
             return (False, str(e))
         finally:
             logger.debug("FFmpeg run completed")
-            self._process = None
+            stderr_file.close()
+            if exit_selector is not None:
+                exit_selector[0].close()
+                os.close(exit_selector[1])
+            if process is not None:
+                with self._processes_lock:
+                    self._processes.discard(process)
     
     def cut_clip(
         self,
@@ -444,7 +966,29 @@ class VideoProcessor:
         Returns:
             True if successful, False otherwise
         """
-        from .logger import get_logger
+        # Clips may run in parallel; one writing the same output path as
+        # another must not put that file in the cache under its own key
+        output_path = task.output_path
+        with self._processes_lock:
+            if self._output_users.get(output_path):
+                self._shared_outputs.add(output_path)
+            self._output_users[output_path] = self._output_users.get(output_path, 0) + 1
+        try:
+            return self._cut_clip(task, quality, progress_callback, log_callback)
+        finally:
+            with self._processes_lock:
+                self._output_users[output_path] -= 1
+                if not self._output_users[output_path]:
+                    del self._output_users[output_path]
+    
+    def _cut_clip(
+        self,
+        task: ClipTask,
+        quality: QualitySettings,
+        progress_callback: Callable[[float], None] | None,
+        log_callback: Callable[[str], None] | None
+    ) -> bool:
+        """Body of cut_clip(), with the task's output path registered."""
         logger = get_logger()
         
         if not task.video_info:
@@ -466,8 +1010,42 @@ class VideoProcessor:
         if log_callback:
             log_callback(f"开始生成: {task.description}.mp4")
         
+        # Ensure output directory exists
+        task.output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Same source, range and quality as an earlier run
+        cache_key = _clip_cache_key(video, seek_time, duration, quality)
+        if task.output_path in self._shared_outputs:
+            cache_key = None
+        if cache_key is not None and _restore_cached_clip(cache_key, task.output_path):
+            logger.info(f"  Reused cached clip: {cache_key}")
+            if log_callback:
+                log_callback(f"使用缓存: {task.description}.mp4")
+            if progress_callback:
+                progress_callback(1.0)
+            task.status = "completed"
+            return True
+        
+        # High quality keeps the source bitrate anyway. When the clip starts
+        # on a keyframe, a stream copy yields the same frames without encoding.
+        run_quality = quality
+        if (quality.bitrate_ratio >= 1.0 and not quality.copy_streams
+                and video.path not in self._copy_failed_sources
+                and _starts_on_keyframe(video.path, seek_time)):
+            logger.info("  Clip starts on a keyframe, using stream copy")
+            run_quality = QualitySettings.stream_copy()
+        
+        # A previous output may be linked to a cache entry; ffmpeg -y would
+        # truncate that entry in place, so start from a new file
+        try:
+            task.output_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        
         # 带重试的执行
         retry_count = 0
+        cmd = None
+        cmd_key = None
         while retry_count <= self.MAX_RETRIES:
             if retry_count > 0:
                 logger.warning(f"Retry {retry_count}/{self.MAX_RETRIES} for: {task.description}")
@@ -475,9 +1053,16 @@ class VideoProcessor:
                     log_callback(f"重试 ({retry_count}/{self.MAX_RETRIES}): {task.description}")
                 task.retry_count = retry_count
             
-            success, error = self._run_ffmpeg_once(task, quality, progress_callback, log_callback)
+            # Stalled retries reuse the command; fallbacks change its key
+            encoder = self._select_encoder()
+            if cmd_key != (run_quality, encoder):
+                cmd_key = (run_quality, encoder)
+                cmd = self._build_cmd(task, run_quality, seek_time, duration, encoder)
+            success, error = self._run_ffmpeg_once(task, cmd, duration, progress_callback)
             
             if success:
+                if cache_key is not None and task.output_path not in self._shared_outputs:
+                    _store_cached_clip(task.output_path, cache_key)
                 task.status = "completed"
                 return True
             
@@ -486,11 +1071,26 @@ class VideoProcessor:
                 task.error = "Task stopped by user"
                 return False
             
+            if run_quality is not quality and error != "STALLED":
+                # E.g. source audio the MP4 container can't hold
+                logger.warning(f"Stream copy failed, re-encoding: {error}")
+                self._copy_failed_sources.add(video.path)
+                run_quality = quality
+                continue
+            
+            if (encoder != 'libx264' and not run_quality.copy_streams
+                    and _is_hw_encoder_error(error, encoder)):
+                # Listed but unusable, e.g. no GPU or driver behind it
+                logger.warning(f"Hardware encoder {encoder} failed, falling back to libx264")
+                if log_callback:
+                    log_callback(f"硬件编码器 {encoder} 不可用，改用 libx264")
+                self._hw_encoder_failed = True
+                continue
+            
             if error == "STALLED":
                 retry_count += 1
                 if retry_count <= self.MAX_RETRIES:
                     logger.info(f"Process stalled, will retry...")
-                    import time
                     time.sleep(1)  # 短暂等待后重试
                     continue
                 else:
@@ -508,22 +1108,39 @@ class VideoProcessor:
         task.error = "Max retries exceeded"
         return False
     
+    def _select_encoder(self) -> str:
+        """Pick the hardware H.264 encoder if ffmpeg has a working one, else libx264."""
+        if self._hw_encoder_failed:
+            return 'libx264'
+        return get_hw_h264_encoder() or 'libx264'
+    
     def pause(self):
-        """Pause current task."""
-        self._paused = True
+        """Pause running tasks, suspending their ffmpeg processes."""
+        with self._processes_lock:
+            self._resume_event.clear()
+            for process in self._processes:
+                _suspend_process(process)
     
     def resume(self):
-        """Resume paused task."""
-        self._paused = False
+        """Resume paused tasks."""
+        with self._processes_lock:
+            for process in self._processes:
+                _resume_process(process)
+            self._resume_event.set()
     
     def stop(self):
-        """Stop current task."""
-        self._stopped = True
-        if self._process:
-            self._process.kill()
+        """Stop all running tasks."""
+        # Under the lock so a concurrent reset() can't clear the flag
+        # between setting it and killing the processes
+        with self._processes_lock:
+            self._stopped = True
+            self._resume_event.set()  # Wake paused tasks so they can exit
+            for process in self._processes:
+                process.kill()  # Also ends suspended processes
     
     def reset(self):
         """Reset processor state."""
-        self._paused = False
-        self._stopped = False
-        self._process = None
+        with self._processes_lock:
+            self._resume_event.set()
+            self._stopped = False
+            self._shared_outputs.clear()